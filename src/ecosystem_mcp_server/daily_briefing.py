@@ -9,15 +9,147 @@ This module generates a comprehensive daily briefing that includes:
 - Calendar/upcoming items (if available)
 """
 
+import copy
+import functools
+import hashlib
 import json
 import logging
+import os
+import re
+import shutil
 import subprocess
+import sys
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+try:
+    import orjson
+except ImportError:  # Optional speedup; fall back to stdlib json
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
+# monarch-mcp-server is not installed as a package; import it from its checkout
+MONARCH_MCP_SRC = Path.home() / "Documents/monarch-mcp-server/src"
+if str(MONARCH_MCP_SRC) not in sys.path:
+    sys.path.insert(0, str(MONARCH_MCP_SRC))
+
+# Upper bound on how long the briefing waits for its components (seconds)
+COMPONENT_TIMEOUT = 30
+
+# Upper bound on how long the status summary waits for its checks (seconds)
+STATUS_CHECK_TIMEOUT = 10
+
+# System states counted as healthy in the ecosystem summary
+HEALTHY_STATES = frozenset({"watching", "connected", "synced", "installed", "idle"})
+
+# icalBuddy location, resolved once per process (None if not installed)
+ICALBUDDY_PATH = shutil.which("icalBuddy")
+
+# icalBuddy query limits
+ICALBUDDY_TIMEOUT = 10
+MAX_CALENDAR_EVENTS = 10
+ICALBUDDY_MAX_OUTPUT = 1_048_576  # Characters of output parsed before giving up
+
+# Strips ANSI color codes from icalBuddy output
+_ANSI_ESCAPE_RE = re.compile(r"\x1b\[[0-9;]*m")
+
+# Cache lifetimes (seconds). Briefing TTLs can be overridden via environment:
+# cached briefings older than the refresh age are still served, but trigger a
+# background rebuild; past the cache TTL they are rebuilt in the foreground.
+BRIEFING_CACHE_TTL = int(os.environ.get("BRIEFING_CACHE_TTL", "120"))
+BRIEFING_REFRESH_AGE = int(os.environ.get("BRIEFING_REFRESH_AGE", "30"))
+CALENDAR_CACHE_TTL = 120
+FINANCIAL_CACHE_TTL = 300
+
+# Maximum number of blocks Notion accepts in a single children payload
+NOTION_MAX_CHILDREN = 100
+
+# Briefings persisted to disk survive process restarts (e.g. repeated CLI runs)
+BRIEFING_DISK_CACHE = Path.home() / "Library/Caches/ecosystem-mcp-server/briefing"
+BRIEFING_DISK_CACHE_MAX_AGE = 3600
+
+# Shared read-only fallback for missing briefing sections
+_EMPTY: Dict[str, Any] = {}
+
+
+def _json_loads(data):
+    """Parse JSON from str or bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+# =============================================================================
+# Lazy Imports
+# =============================================================================
+# Sibling modules are imported on first use to avoid circular imports with
+# server.py; the results are memoized so repeated calls skip the import machinery.
+
+@functools.lru_cache(maxsize=1)
+def _get_server():
+    """Return the server module."""
+    from . import server
+    return server
+
+
+@functools.lru_cache(maxsize=1)
+def _get_notion_control():
+    """Return the notion_control module."""
+    from . import notion_control
+    return notion_control
+
+
+@functools.lru_cache(maxsize=1)
+def _get_monarch_funcs():
+    """Return (get_accounts, get_cashflow) from monarch-mcp-server."""
+    from monarch_mcp_server.server import get_accounts, get_cashflow
+    return get_accounts, get_cashflow
+
+
+# =============================================================================
+# Result Cache
+# =============================================================================
+
+# Maps cache key -> (monotonic timestamp, result)
+_CACHE: Dict[tuple, tuple] = {}
+_CACHE_LOCK = threading.Lock()
+
+
+def _cache_get(key: tuple, ttl: float) -> Optional[Dict[str, Any]]:
+    """Return a copy of a cached result if it is younger than ttl seconds."""
+    with _CACHE_LOCK:
+        entry = _CACHE.get(key)
+    if entry and time.monotonic() - entry[0] < ttl:
+        return copy.deepcopy(entry[1])
+    return None
+
+
+def _cache_age(key: tuple) -> Optional[float]:
+    """Return the age in seconds of a cached result, or None if not cached."""
+    with _CACHE_LOCK:
+        entry = _CACHE.get(key)
+    return time.monotonic() - entry[0] if entry else None
+
+
+def _cache_set(key: tuple, value: Dict[str, Any], age: float = 0.0) -> None:
+    """
+    Store a result in the cache. Error results are never cached.
+
+    `age` is how many seconds ago the result was built, so a result loaded
+    from elsewhere (e.g. the disk cache) expires on its original schedule.
+    """
+    if "error" in value:
+        return
+    with _CACHE_LOCK:
+        _CACHE[key] = (time.monotonic() - age, copy.deepcopy(value))
+
 
 # =============================================================================
 # Component: Ecosystem Status
@@ -30,17 +162,39 @@ def get_ecosystem_status_summary() -> Dict[str, Any]:
     Returns:
         Dict with status of each system and attention items.
     """
-    from . import server
+    server = _get_server()
 
     try:
-        status = {
-            "downloads_organizer": server.check_downloads_organizer(),
-            "tax_organizer": server.check_tax_organizer(),
-            "monarch_money": server.check_monarch_money(),
-            "context_sync": server.check_context_sync(),
-            "notion_rules": server.check_notion_rules(),
+        checks = {
+            "downloads_organizer": server.check_downloads_organizer,
+            "tax_organizer": server.check_tax_organizer,
+            "monarch_money": server.check_monarch_money,
+            "context_sync": server.check_context_sync,
+            "notion_rules": server.check_notion_rules,
         }
 
+        # Probes are independent, so run them concurrently under one deadline;
+        # a probe still running when it passes is reported as timed out
+        status = {}
+        executor = ThreadPoolExecutor(max_workers=len(checks))
+        try:
+            futures = {name: executor.submit(fn) for name, fn in checks.items()}
+            deadline = time.monotonic() + STATUS_CHECK_TIMEOUT
+            for name, future in futures.items():
+                try:
+                    status[name] = future.result(timeout=max(0.0, deadline - time.monotonic()))
+                except FutureTimeoutError:
+                    logger.warning(f"Status check '{name}' timed out")
+                    status[name] = {
+                        "status": "error",
+                        "attention": [f"Timed out after {STATUS_CHECK_TIMEOUT}s"],
+                    }
+                except Exception as e:
+                    logger.warning(f"Status check '{name}' failed: {e}")
+                    status[name] = {"status": "error", "attention": [str(e)]}
+        finally:
+            executor.shutdown(wait=False)
+
         # Count healthy vs needs attention
         healthy = 0
         attention_needed = 0
@@ -48,13 +202,16 @@ def get_ecosystem_status_summary() -> Dict[str, Any]:
 
         for name, check in status.items():
             check_status = check.get("status", "unknown")
-            if check_status in ["watching", "connected", "synced", "installed", "idle"]:
+            if check_status in HEALTHY_STATES:
                 healthy += 1
             else:
                 attention_needed += 1
 
-            for item in check.get("attention", []):
-                attention_items.append(f"{check.get('icon', '•')} {check.get('name', name)}: {item}")
+            attention = check.get("attention")
+            if not attention:
+                continue
+            prefix = f"{check.get('icon', '•')} {check.get('name', name)}: "
+            attention_items.extend(prefix + item for item in attention)
 
         return {
             "healthy": healthy,
@@ -78,32 +235,20 @@ def get_pending_documents() -> Dict[str, Any]:
     Returns:
         Dict with pending PDFs, media files, and documents needing review.
     """
-    from . import server
+    server = _get_server()
 
     try:
-        home = Path.home()
-        downloads = home / "Downloads"
-
-        # Count pending files in Downloads
-        pdf_count = server.count_files_in_downloads(["pdf"])
-        media_exts = ["jpg", "jpeg", "png", "heic", "mov", "mp4", "mp3", "m4a"]
-        media_count = server.count_files_in_downloads(media_exts)
+        # Count pending files in Downloads (single directory pass)
+        counts = server.count_pending_downloads()
+        pdf_count = counts["pdf"]
+        media_count = counts["media"]
 
         # Check notion-rules for documents needing review
         needs_review = 0
         notion_rules_repo = server.REPOS.get("notion_rules")
         if notion_rules_repo and notion_rules_repo.exists():
             checkpoint = notion_rules_repo / "tax-years/data/processing_checkpoint.json"
-            if checkpoint.exists():
-                try:
-                    with open(checkpoint) as f:
-                        data = json.load(f)
-                        needs_review = sum(
-                            1 for r in data.get("results", [])
-                            if r.get("needs_review", False)
-                        )
-                except Exception:
-                    pass
+            needs_review = server.count_needs_review(checkpoint)
 
         return {
             "pending_pdfs": pdf_count,
@@ -120,53 +265,65 @@ def get_pending_documents() -> Dict[str, Any]:
 # Component: Financial Summary
 # =============================================================================
 
-def get_financial_summary() -> Dict[str, Any]:
+def get_financial_summary(
+    force_refresh: bool = False,
+    now: Optional[datetime] = None,
+) -> Dict[str, Any]:
     """
     Get financial summary from Monarch Money.
 
-    Note: Requires monarch-mcp-server to be authenticated.
+    Note: Requires monarch-mcp-server to be authenticated. Results are cached
+    for FINANCIAL_CACHE_TTL seconds since Monarch data changes slowly.
+
+    Args:
+        force_refresh: Bypass the cache and query Monarch directly
+        now: Reference time for month-to-date figures (default: current time)
 
     Returns:
         Dict with account balances and recent spending summary.
     """
+    if not force_refresh:
+        cached = _cache_get(("financial",), FINANCIAL_CACHE_TTL)
+        if cached is not None:
+            return cached
+
+    result = _fetch_financial_summary(now or datetime.now())
+    _cache_set(("financial",), result)
+    return result
+
+
+def _fetch_financial_summary(now: datetime) -> Dict[str, Any]:
+    """Query Monarch Money for the financial summary (uncached)."""
     try:
         # Import monarch-mcp-server functions
-        import sys
-        monarch_path = Path.home() / "Documents/monarch-mcp-server/src"
-        if str(monarch_path) not in sys.path:
-            sys.path.insert(0, str(monarch_path))
-
-        from monarch_mcp_server.server import get_accounts, get_cashflow
+        get_accounts, get_cashflow = _get_monarch_funcs()
 
         # Get accounts summary
         accounts_json = get_accounts()
-        accounts = json.loads(accounts_json) if not accounts_json.startswith("Error") else []
+        accounts = _json_loads(accounts_json) if not accounts_json.startswith("Error") else []
 
         if isinstance(accounts, list):
-            # Calculate totals by account type
-            totals = {}
+            # Calculate totals by account type and count active accounts in one pass
+            totals = defaultdict(float)
+            active_count = 0
             for account in accounts:
                 if account.get("is_active", True):
-                    acct_type = account.get("type", "Other")
-                    balance = account.get("balance", 0) or 0
-                    if acct_type not in totals:
-                        totals[acct_type] = 0
-                    totals[acct_type] += balance
+                    active_count += 1
+                    totals[account.get("type", "Other")] += account.get("balance", 0) or 0
 
             # Get recent cashflow
-            today = datetime.now()
-            start_of_month = today.replace(day=1).strftime("%Y-%m-%d")
-            end_of_today = today.strftime("%Y-%m-%d")
+            start_of_month = now.replace(day=1).strftime("%Y-%m-%d")
+            end_of_today = now.strftime("%Y-%m-%d")
             cashflow_json = get_cashflow(start_date=start_of_month, end_date=end_of_today)
-            cashflow = json.loads(cashflow_json) if not cashflow_json.startswith("Error") else {}
+            cashflow = _json_loads(cashflow_json) if not cashflow_json.startswith("Error") else {}
 
             # Extract summary - API returns summary as a list with nested summary dict
             summary_list = cashflow.get("summary", [])
             summary = summary_list[0].get("summary", {}) if summary_list else {}
 
             return {
-                "account_count": len([a for a in accounts if a.get("is_active", True)]),
-                "totals_by_type": totals,
+                "account_count": active_count,
+                "totals_by_type": dict(totals),
                 "net_worth": sum(totals.values()),
                 "mtd_income": summary.get("sumIncome", 0),
                 "mtd_expenses": summary.get("sumExpense", 0),
@@ -194,7 +351,7 @@ def get_pending_requests() -> Dict[str, Any]:
         Dict with count and list of pending requests.
     """
     try:
-        from . import notion_control
+        notion_control = _get_notion_control()
 
         requests = notion_control.get_pending_requests()
 
@@ -219,80 +376,145 @@ def get_pending_requests() -> Dict[str, Any]:
 # Component: Calendar
 # =============================================================================
 
-def get_calendar_events(days: int = 1) -> Dict[str, Any]:
+def get_calendar_events(days: int = 1, force_refresh: bool = False) -> Dict[str, Any]:
     """
     Get upcoming calendar events using icalBuddy (if available).
 
+    Results are cached for CALENDAR_CACHE_TTL seconds since icalBuddy is the
+    slowest briefing component.
+
     Args:
         days: Number of days to look ahead (default: 1)
+        force_refresh: Bypass the cache and query icalBuddy directly
 
     Returns:
         Dict with upcoming events.
     """
-    import re
+    if not force_refresh:
+        cached = _cache_get(("calendar", days), CALENDAR_CACHE_TTL)
+        if cached is not None:
+            return cached
+
+    result = _fetch_calendar_events(days)
+    _cache_set(("calendar", days), result)
+    return result
+
+
+class _BoundedLines:
+    """Iterate lines from a text stream, stopping once max_chars have been read."""
+
+    def __init__(self, stream: Iterable[str], max_chars: int):
+        self.stream = stream
+        self.max_chars = max_chars
+        self.truncated = False
+
+    def __iter__(self) -> Iterator[str]:
+        read = 0
+        for line in self.stream:
+            read += len(line)
+            if read > self.max_chars:
+                self.truncated = True
+                return
+            yield line
+
+
+def _parse_icalbuddy_events(lines: Iterable[str]) -> Iterator[Dict[str, str]]:
+    """Yield event dicts from icalBuddy output lines as each event completes."""
+    current_event = None
+
+    for line in lines:
+        # Remove ANSI escape codes from output
+        line = _ANSI_ESCAPE_RE.sub("", line).rstrip("\n")
+        if not line.strip():
+            continue
+
+        # Event titles start with bullet
+        if line.startswith(("•", "*")):
+            if current_event:
+                yield current_event
+            current_event = {"title": line.lstrip("•* ").strip()}
+        elif current_event:
+            stripped = line.strip()
+            # Check if it looks like a time (contains AM/PM)
+            if "PM" in stripped or "AM" in stripped:
+                current_event["time"] = stripped
+            elif stripped.startswith("attendees:"):
+                pass  # Skip attendees line
+
+    if current_event:
+        yield current_event
+
+
+def _fetch_calendar_events(days: int) -> Dict[str, Any]:
+    """Query icalBuddy for upcoming events (uncached)."""
+    # Check if icalBuddy is installed
+    if ICALBUDDY_PATH is None:
+        return {
+            "available": False,
+            "hint": "Install icalBuddy for calendar integration: brew install ical-buddy",
+        }
 
     try:
-        # Check if icalBuddy is installed
-        result = subprocess.run(
-            ["which", "icalBuddy"],
-            capture_output=True,
-            text=True,
-            timeout=5
-        )
-
-        if result.returncode != 0:
-            return {
-                "available": False,
-                "hint": "Install icalBuddy for calendar integration: brew install ical-buddy",
-            }
-
         # Get events for today and upcoming days
         # Use eventsToday+N syntax (N=0 means just today)
-        result = subprocess.run(
+        proc = subprocess.Popen(
             [
-                "icalBuddy",
+                ICALBUDDY_PATH,
                 "-nc",  # No calendar names
                 "-nrd",  # No relative dates
                 "-n",  # Include only unfinished events
                 f"eventsToday+{days - 1}",
             ],
-            capture_output=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
             text=True,
-            timeout=10
         )
 
-        if result.returncode == 0:
-            events = []
-            current_event = None
-
-            # Remove ANSI escape codes from output
-            clean_output = re.sub(r'\x1b\[[0-9;]*m', '', result.stdout)
-
-            for line in clean_output.strip().split("\n"):
-                if not line.strip():
-                    continue
-
-                # Event titles start with bullet
-                if line.startswith("•") or line.startswith("*"):
-                    if current_event:
-                        events.append(current_event)
-                    current_event = {"title": line.lstrip("•* ").strip()}
-                elif current_event and line.strip():
-                    stripped = line.strip()
-                    # Check if it looks like a time (contains AM/PM)
-                    if "PM" in stripped or "AM" in stripped:
-                        current_event["time"] = stripped
-                    elif stripped.startswith("attendees:"):
-                        pass  # Skip attendees line
+        # Reading stdout blocks, so a watchdog kills icalBuddy if it hangs
+        timed_out = threading.Event()
 
-            if current_event:
-                events.append(current_event)
+        def _kill_on_timeout():
+            timed_out.set()
+            proc.kill()
 
-            return {
+        watchdog = threading.Timer(ICALBUDDY_TIMEOUT, _kill_on_timeout)
+        watchdog.start()
+
+        # Parse line by line, keeping the first MAX_CALENDAR_EVENTS events but
+        # counting all of them (up to the output cap)
+        try:
+            lines = _BoundedLines(proc.stdout, ICALBUDDY_MAX_OUTPUT)
+            events = []
+            event_count = 0
+            for event in _parse_icalbuddy_events(lines):
+                event_count += 1
+                if event_count <= MAX_CALENDAR_EVENTS:
+                    events.append(event)
+            stopped_early = lines.truncated
+            if stopped_early:
+                proc.terminate()
+            try:
+                returncode = proc.wait(timeout=ICALBUDDY_TIMEOUT)
+            except subprocess.TimeoutExpired:
+                proc.kill()
+                returncode = proc.wait()
+        finally:
+            watchdog.cancel()
+            proc.stdout.close()
+
+        if timed_out.is_set():
+            raise subprocess.TimeoutExpired(ICALBUDDY_PATH, ICALBUDDY_TIMEOUT)
+
+        if stopped_early or returncode == 0:
+            result = {
                 "available": True,
-                "event_count": len(events),
-                "events": events[:10],  # Limit to 10 events
+                "event_count": event_count,
+                "events": events,
             }
+            if stopped_early:
+                # Output was cut off, so there may be more events than counted
+                result["count_truncated"] = True
+            return result
         else:
             return {
                 "available": True,
@@ -317,34 +539,164 @@ def get_calendar_events(days: int = 1) -> Dict[str, Any]:
 # Main Briefing Generator
 # =============================================================================
 
-def generate_briefing(include_financial: bool = True, include_calendar: bool = True) -> Dict[str, Any]:
+def generate_briefing(
+    include_financial: bool = True,
+    include_calendar: bool = True,
+    force_refresh: bool = False,
+) -> Dict[str, Any]:
     """
     Generate the complete daily briefing.
 
+    Briefings are cached for BRIEFING_CACHE_TTL seconds so rapid re-invocations
+    (dashboards, notifications) don't recompute every component. Cached
+    briefings older than BRIEFING_REFRESH_AGE are refreshed in the background.
+
     Args:
         include_financial: Include Monarch Money data (requires auth)
         include_calendar: Include calendar events (requires icalBuddy)
+        force_refresh: Bypass the cache and rebuild the briefing
 
     Returns:
         Complete briefing dict with all components.
     """
+    cache_key = ("briefing", include_financial, include_calendar)
+    if not force_refresh:
+        cached = _cache_get(cache_key, BRIEFING_CACHE_TTL)
+        if cached is not None:
+            age = _cache_age(cache_key)
+            if age is not None and age > BRIEFING_REFRESH_AGE:
+                _refresh_briefing_in_background(cache_key, include_financial, include_calendar)
+            return cached
+
+        # Fall back to a briefing persisted by another process this minute
+        disk_entry = _read_disk_cache(include_financial, include_calendar)
+        if disk_entry is not None:
+            cached, age = disk_entry
+            _cache_set(cache_key, cached, age=age)
+            return cached
+
+    briefing = _build_briefing(include_financial, include_calendar)
+    _cache_set(cache_key, briefing)
+    _write_disk_cache(include_financial, include_calendar, briefing)
+    return briefing
+
+
+def _disk_cache_path(include_financial: bool, include_calendar: bool) -> Path:
+    """Return the disk cache file for a briefing, keyed by flags and minute."""
+    minute = int(time.time() // 60)
+    key = hashlib.sha256(f"{include_financial}|{include_calendar}|{minute}".encode()).hexdigest()
+    return BRIEFING_DISK_CACHE / f"{key}.json"
+
+
+def _read_disk_cache(include_financial: bool, include_calendar: bool) -> Optional[tuple]:
+    """
+    Load a briefing persisted earlier in the current minute, if any.
+
+    Returns:
+        Tuple of (briefing, seconds since it was written), or None
+    """
+    path = _disk_cache_path(include_financial, include_calendar)
+    try:
+        with open(path, "rb") as f:
+            age = max(0.0, time.time() - os.fstat(f.fileno()).st_mtime)
+            return _json_loads(f.read()), age
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.warning(f"Failed to read briefing disk cache: {e}")
+        return None
+
+
+def _write_disk_cache(include_financial: bool, include_calendar: bool, briefing: Dict[str, Any]) -> None:
+    """Persist a briefing atomically and purge entries older than an hour."""
+    try:
+        BRIEFING_DISK_CACHE.mkdir(parents=True, exist_ok=True)
+        path = _disk_cache_path(include_financial, include_calendar)
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        if orjson is not None:
+            tmp_path.write_bytes(orjson.dumps(briefing, default=str))
+        else:
+            tmp_path.write_text(json.dumps(briefing, default=str))
+        os.replace(tmp_path, path)
+
+        cutoff = time.time() - BRIEFING_DISK_CACHE_MAX_AGE
+        for entry in BRIEFING_DISK_CACHE.iterdir():
+            if entry.stat().st_mtime < cutoff:
+                entry.unlink(missing_ok=True)
+    except Exception as e:
+        logger.warning(f"Failed to write briefing disk cache: {e}")
+
+
+# Cache keys with a background refresh currently in flight
+_REFRESHING: set = set()
+
+
+def _refresh_briefing_in_background(
+    cache_key: tuple,
+    include_financial: bool,
+    include_calendar: bool,
+) -> None:
+    """Rebuild a cached briefing on a daemon thread, at most one per key."""
+    with _CACHE_LOCK:
+        if cache_key in _REFRESHING:
+            return
+        _REFRESHING.add(cache_key)
+
+    def _refresh():
+        try:
+            _cache_set(cache_key, _build_briefing(include_financial, include_calendar))
+        except Exception as e:
+            logger.error(f"Background briefing refresh failed: {e}")
+        finally:
+            with _CACHE_LOCK:
+                _REFRESHING.discard(cache_key)
+
+    threading.Thread(target=_refresh, daemon=True).start()
+
+
+def _build_briefing(include_financial: bool, include_calendar: bool) -> Dict[str, Any]:
+    """Collect all briefing components and build the briefing dict (uncached)."""
+    # One timestamp for the whole briefing keeps its fields consistent
+    now = datetime.now()
     briefing = {
-        "generated_at": datetime.now().isoformat(),
-        "greeting": _get_greeting(),
-        "date": datetime.now().strftime("%A, %B %d, %Y"),
+        "generated_at": now.isoformat(),
+        "greeting": _get_greeting(now),
+        "date": now.strftime("%A, %B %d, %Y"),
     }
 
     # Always include these
-    briefing["ecosystem"] = get_ecosystem_status_summary()
-    briefing["documents"] = get_pending_documents()
-    briefing["automation"] = get_pending_requests()
+    components = {
+        "ecosystem": get_ecosystem_status_summary,
+        "documents": get_pending_documents,
+        "automation": get_pending_requests,
+    }
 
     # Optional components
     if include_financial:
-        briefing["financial"] = get_financial_summary()
+        components["financial"] = functools.partial(get_financial_summary, now=now)
 
     if include_calendar:
-        briefing["calendar"] = get_calendar_events()
+        components["calendar"] = get_calendar_events
+
+    # Components are independent I/O (subprocess, filesystem, network), so
+    # fetch them concurrently and let the slowest one set the latency. All of
+    # them share one deadline, and a component still running when it passes
+    # is reported as an error instead of holding up the briefing.
+    executor = ThreadPoolExecutor(max_workers=len(components))
+    try:
+        futures = {key: executor.submit(fn) for key, fn in components.items()}
+        deadline = time.monotonic() + COMPONENT_TIMEOUT
+        for key, future in futures.items():
+            try:
+                briefing[key] = future.result(timeout=max(0.0, deadline - time.monotonic()))
+            except FutureTimeoutError:
+                logger.error(f"Briefing component '{key}' timed out")
+                briefing[key] = {"error": f"Timed out after {COMPONENT_TIMEOUT}s"}
+            except Exception as e:
+                logger.error(f"Briefing component '{key}' failed: {e}")
+                briefing[key] = {"error": str(e)}
+    finally:
+        executor.shutdown(wait=False)
 
     # Generate summary
     briefing["summary"] = _generate_summary(briefing)
@@ -352,9 +704,14 @@ def generate_briefing(include_financial: bool = True, include_calendar: bool = T
     return briefing
 
 
-def _get_greeting() -> str:
+def _get_greeting(now: Optional[datetime] = None) -> str:
     """Get time-appropriate greeting."""
-    hour = datetime.now().hour
+    return _greeting_for_hour((now or datetime.now()).hour)
+
+
+@functools.lru_cache(maxsize=24)
+def _greeting_for_hour(hour: int) -> str:
+    """Map an hour of the day (0-23) to a greeting."""
     if hour < 12:
         return "Good morning"
     elif hour < 17:
@@ -365,33 +722,28 @@ def _get_greeting() -> str:
 
 def _generate_summary(briefing: Dict[str, Any]) -> str:
     """Generate a brief text summary of the briefing."""
-    parts = []
-
-    # Ecosystem status
-    eco = briefing.get("ecosystem", {})
-    if eco.get("attention_needed", 0) > 0:
-        parts.append(f"{eco['attention_needed']} system(s) need attention")
-    else:
-        parts.append(f"All {eco.get('healthy', 0)} systems healthy")
+    eco = briefing.get("ecosystem") or _EMPTY
+    docs = briefing.get("documents") or _EMPTY
+    auto = briefing.get("automation") or _EMPTY
+    cal = briefing.get("calendar") or _EMPTY
 
-    # Pending documents
-    docs = briefing.get("documents", {})
+    attention = eco.get("attention_needed", 0)
     total_pending = docs.get("total_pending", 0)
-    if total_pending > 0:
-        parts.append(f"{total_pending} document(s) pending")
-
-    # Automation requests
-    auto = briefing.get("automation", {})
     pending_requests = auto.get("pending_count", 0)
-    if pending_requests > 0:
-        parts.append(f"{pending_requests} automation request(s) queued")
+    event_count = cal.get("event_count", 0) if cal.get("available") else 0
 
-    # Calendar
-    cal = briefing.get("calendar", {})
-    if cal.get("available") and cal.get("event_count", 0) > 0:
-        parts.append(f"{cal['event_count']} event(s) today")
+    parts = [
+        # Ecosystem status always leads the summary
+        f"{attention} system(s) need attention" if attention > 0
+        else f"All {eco.get('healthy', 0)} systems healthy",
+    ]
+    parts.extend(text for cond, text in (
+        (total_pending > 0, f"{total_pending} document(s) pending"),
+        (pending_requests > 0, f"{pending_requests} automation request(s) queued"),
+        (event_count > 0, f"{event_count}{'+' if cal.get('count_truncated') else ''} event(s) today"),
+    ) if cond)
 
-    return ". ".join(parts) + "." if parts else "All clear!"
+    return ". ".join(parts) + "."
 
 
 def format_briefing_text(briefing: Dict[str, Any]) -> str:
@@ -404,48 +756,53 @@ def format_briefing_text(briefing: Dict[str, Any]) -> str:
     Returns:
         Formatted text string.
     """
-    lines = []
-
-    # Header
-    lines.append(f"# {briefing.get('greeting', 'Hello')}!")
-    lines.append(f"**{briefing.get('date', '')}**")
-    lines.append("")
-
-    # Summary
-    lines.append(f"*{briefing.get('summary', '')}*")
-    lines.append("")
+    eco = briefing.get("ecosystem", {})
+    docs = briefing.get("documents", {})
+    auto = briefing.get("automation", {})
+    fin = briefing.get("financial")
+    cal = briefing.get("calendar")
+
+    # Header and summary
+    lines = [
+        f"# {briefing.get('greeting', 'Hello')}!",
+        f"**{briefing.get('date', '')}**",
+        "",
+        f"*{briefing.get('summary', '')}*",
+        "",
+        "## Ecosystem Status",
+    ]
 
     # Ecosystem Status
-    lines.append("## Ecosystem Status")
-    eco = briefing.get("ecosystem", {})
     if "error" not in eco:
-        lines.append(f"- Healthy: {eco.get('healthy', 0)}")
-        lines.append(f"- Needs attention: {eco.get('attention_needed', 0)}")
-        for item in eco.get("attention_items", [])[:5]:
-            lines.append(f"  - {item}")
+        lines.extend((
+            f"- Healthy: {eco.get('healthy', 0)}",
+            f"- Needs attention: {eco.get('attention_needed', 0)}",
+        ))
+        lines.extend(f"  - {item}" for item in eco.get("attention_items", [])[:5])
     else:
         lines.append(f"- Error: {eco.get('error')}")
-    lines.append("")
+    lines.extend(("", "## Pending Documents"))
 
     # Pending Documents
-    lines.append("## Pending Documents")
-    docs = briefing.get("documents", {})
     if "error" not in docs:
-        lines.append(f"- PDFs: {docs.get('pending_pdfs', 0)}")
-        lines.append(f"- Media: {docs.get('pending_media', 0)}")
-        lines.append(f"- Needs review: {docs.get('needs_review', 0)}")
+        lines.extend((
+            f"- PDFs: {docs.get('pending_pdfs', 0)}",
+            f"- Media: {docs.get('pending_media', 0)}",
+            f"- Needs review: {docs.get('needs_review', 0)}",
+        ))
     else:
         lines.append(f"- Error: {docs.get('error')}")
     lines.append("")
 
     # Financial Summary (if included)
-    if "financial" in briefing:
+    if fin is not None:
         lines.append("## Financial Summary")
-        fin = briefing["financial"]
         if "error" not in fin:
-            lines.append(f"- Net worth: ${fin.get('net_worth', 0):,.2f}")
-            lines.append(f"- MTD Income: ${fin.get('mtd_income', 0):,.2f}")
-            lines.append(f"- MTD Expenses: ${abs(fin.get('mtd_expenses', 0)):,.2f}")
+            lines.extend((
+                f"- Net worth: ${fin.get('net_worth', 0):,.2f}",
+                f"- MTD Income: ${fin.get('mtd_income', 0):,.2f}",
+                f"- MTD Expenses: ${abs(fin.get('mtd_expenses', 0)):,.2f}",
+            ))
         else:
             lines.append(f"- {fin.get('error')}")
             if fin.get("hint"):
@@ -454,13 +811,14 @@ def format_briefing_text(briefing: Dict[str, Any]) -> str:
 
     # Automation Requests
     lines.append("## Automation Requests")
-    auto = briefing.get("automation", {})
     if "error" not in auto:
         pending = auto.get("pending_count", 0)
         if pending > 0:
             lines.append(f"- {pending} request(s) pending:")
-            for req in auto.get("requests", [])[:3]:
-                lines.append(f"  - {req.get('name', 'Unnamed')}: {req.get('command', '')} {req.get('arguments', '')}")
+            lines.extend(
+                f"  - {req.get('name', 'Unnamed')}: {req.get('command', '')} {req.get('arguments', '')}"
+                for req in auto.get("requests", [])[:3]
+            )
         else:
             lines.append("- No pending requests")
     else:
@@ -468,18 +826,18 @@ def format_briefing_text(briefing: Dict[str, Any]) -> str:
     lines.append("")
 
     # Calendar (if included)
-    if "calendar" in briefing:
+    if cal is not None:
         lines.append("## Today's Events")
-        cal = briefing["calendar"]
         if cal.get("available"):
             if cal.get("event_count", 0) > 0:
-                for event in cal.get("events", [])[:5]:
-                    time_str = event.get("time", "")
-                    lines.append(f"- {time_str} {event.get('title', 'Untitled')}")
+                lines.extend(
+                    f"- {event.get('time', '')} {event.get('title', 'Untitled')}"
+                    for event in cal.get("events", [])[:5]
+                )
             else:
                 lines.append("- No events scheduled")
         else:
-            lines.append(f"- Calendar not available")
+            lines.append("- Calendar not available")
             if cal.get("hint"):
                 lines.append(f"- {cal.get('hint')}")
 
@@ -494,6 +852,7 @@ def save_briefing_to_notion(
     briefing: Optional[Dict[str, Any]] = None,
     include_financial: bool = True,
     include_calendar: bool = True,
+    now: Optional[datetime] = None,
 ) -> Dict[str, Any]:
     """
     Generate and save a daily briefing to Notion.
@@ -505,11 +864,12 @@ def save_briefing_to_notion(
         briefing: Pre-generated briefing dict, or None to generate fresh
         include_financial: Include Monarch Money data (if generating)
         include_calendar: Include calendar events (if generating)
+        now: Date used for the page title (default: current time)
 
     Returns:
         Dict with success status, page_id, and url
     """
-    from . import notion_control
+    notion_control = _get_notion_control()
 
     try:
         # Generate briefing if not provided
@@ -531,12 +891,19 @@ def save_briefing_to_notion(
             return {"success": False, "error": "Daily Briefings database not configured"}
 
         # Create the page
-        today = datetime.now()
+        today = now or datetime.now()
         title = f"Daily Briefing - {today.strftime('%b %d, %Y')}"
 
+        # Notion accepts at most 100 children per request
+        blocks = _create_notion_blocks(briefing)
+        first_batch = blocks[:NOTION_MAX_CHILDREN]
+
         # Use "Name" as title property (default for Notion databases)
         # All content goes in the page body for better mobile reading
-        response = client.pages.create(
+        # Notion calls go through notion_control's shared rate limiter and retries
+        response = notion_control.call_notion(
+            client.pages.create,
+            idempotent=False,
             parent={"database_id": db_id},
             properties={
                 "Name": {
@@ -544,12 +911,21 @@ def save_briefing_to_notion(
                 },
             },
             # Add full content as page body for easier reading
-            children=_create_notion_blocks(briefing),
+            children=first_batch,
         )
 
         page_id = response["id"]
         url = response.get("url", "")
 
+        # Append any overflow in order (concurrent appends could reorder blocks)
+        for i in range(NOTION_MAX_CHILDREN, len(blocks), NOTION_MAX_CHILDREN):
+            notion_control.call_notion(
+                client.blocks.children.append,
+                idempotent=False,
+                block_id=page_id,
+                children=blocks[i:i + NOTION_MAX_CHILDREN],
+            )
+
         logger.info(f"Saved briefing to Notion: {page_id}")
 
         return {
@@ -578,69 +954,71 @@ def _format_briefing_for_notion(briefing: Dict[str, Any]) -> str:
     return " | ".join(parts)
 
 
-def _create_notion_blocks(briefing: Dict[str, Any]) -> List[Dict]:
-    """Create Notion blocks for the full briefing content."""
-    blocks = []
+# Shared divider block (never mutated, so one instance serves every briefing)
+_DIVIDER = {"type": "divider", "divider": {}}
 
-    # Greeting and summary
-    blocks.append({
-        "type": "heading_1",
-        "heading_1": {
-            "rich_text": [{"type": "text", "text": {"content": f"{briefing.get('greeting', 'Hello')}!"}}]
-        }
-    })
 
-    blocks.append({
-        "type": "paragraph",
-        "paragraph": {
-            "rich_text": [{"type": "text", "text": {"content": briefing.get("summary", "")}}]
-        }
-    })
+def _text(content: str, bold: bool = False) -> Dict[str, Any]:
+    """Build a Notion rich_text segment."""
+    segment = {"type": "text", "text": {"content": content}}
+    if bold:
+        segment["annotations"] = {"bold": True}
+    return segment
+
+
+def _block(block_type: str, *segments: Dict[str, Any]) -> Dict[str, Any]:
+    """Build a Notion text block of the given type from rich_text segments."""
+    return {"type": block_type, block_type: {"rich_text": list(segments)}}
+
+
+def _h1(content: str) -> Dict[str, Any]:
+    return _block("heading_1", _text(content))
+
 
-    blocks.append({"type": "divider", "divider": {}})
+def _h2(content: str) -> Dict[str, Any]:
+    return _block("heading_2", _text(content))
+
+
+def _para(content: str) -> Dict[str, Any]:
+    return _block("paragraph", _text(content))
+
+
+def _bullet(content: str) -> Dict[str, Any]:
+    return _block("bulleted_list_item", _text(content))
+
+
+def _create_notion_blocks(briefing: Dict[str, Any]) -> List[Dict]:
+    """Create Notion blocks for the full briefing content."""
+    # Greeting and summary
+    blocks = [
+        _h1(f"{briefing.get('greeting', 'Hello')}!"),
+        _para(briefing.get("summary", "")),
+        _DIVIDER,
+    ]
 
     # Calendar events (most important for mobile)
-    cal = briefing.get("calendar", {})
+    cal = briefing.get("calendar") or _EMPTY
     if cal.get("available"):
-        blocks.append({
-            "type": "heading_2",
-            "heading_2": {
-                "rich_text": [{"type": "text", "text": {"content": "📅 Today's Schedule"}}]
-            }
-        })
+        blocks.append(_h2("📅 Today's Schedule"))
 
         if cal.get("event_count", 0) > 0:
-            for event in cal.get("events", [])[:10]:
-                time_str = event.get("time", "All day")
-                title = event.get("title", "Untitled")
-                blocks.append({
-                    "type": "bulleted_list_item",
-                    "bulleted_list_item": {
-                        "rich_text": [
-                            {"type": "text", "text": {"content": f"{time_str}: "}, "annotations": {"bold": True}},
-                            {"type": "text", "text": {"content": title}},
-                        ]
-                    }
-                })
+            blocks.extend(
+                _block(
+                    "bulleted_list_item",
+                    _text(f"{event.get('time', 'All day')}: ", bold=True),
+                    _text(event.get("title", "Untitled")),
+                )
+                for event in cal.get("events", [])[:10]
+            )
         else:
-            blocks.append({
-                "type": "paragraph",
-                "paragraph": {
-                    "rich_text": [{"type": "text", "text": {"content": "No events scheduled today."}}]
-                }
-            })
+            blocks.append(_para("No events scheduled today."))
 
-        blocks.append({"type": "divider", "divider": {}})
+        blocks.append(_DIVIDER)
 
     # Ecosystem status
-    blocks.append({
-        "type": "heading_2",
-        "heading_2": {
-            "rich_text": [{"type": "text", "text": {"content": "🔧 Ecosystem Status"}}]
-        }
-    })
+    blocks.append(_h2("🔧 Ecosystem Status"))
 
-    eco = briefing.get("ecosystem", {})
+    eco = briefing.get("ecosystem") or _EMPTY
     if "error" not in eco:
         healthy = eco.get("healthy", 0)
         attention = eco.get("attention_needed", 0)
@@ -649,93 +1027,41 @@ def _create_notion_blocks(briefing: Dict[str, Any]) -> List[Dict]:
         if attention > 0:
             status_text += f" | ⚠️ {attention} need attention"
 
-        blocks.append({
-            "type": "paragraph",
-            "paragraph": {
-                "rich_text": [{"type": "text", "text": {"content": status_text}}]
-            }
-        })
+        blocks.append(_para(status_text))
+        blocks.extend(_bullet(item) for item in eco.get("attention_items", [])[:5])
 
-        for item in eco.get("attention_items", [])[:5]:
-            blocks.append({
-                "type": "bulleted_list_item",
-                "bulleted_list_item": {
-                    "rich_text": [{"type": "text", "text": {"content": item}}]
-                }
-            })
-
-    blocks.append({"type": "divider", "divider": {}})
+    blocks.append(_DIVIDER)
 
     # Pending documents
-    docs = briefing.get("documents", {})
-    if "error" not in docs:
-        total = docs.get("total_pending", 0)
-        if total > 0:
-            blocks.append({
-                "type": "heading_2",
-                "heading_2": {
-                    "rich_text": [{"type": "text", "text": {"content": "📄 Pending Documents"}}]
-                }
-            })
-
-            blocks.append({
-                "type": "paragraph",
-                "paragraph": {
-                    "rich_text": [{"type": "text", "text": {
-                        "content": f"PDFs: {docs.get('pending_pdfs', 0)} | Media: {docs.get('pending_media', 0)} | Review: {docs.get('needs_review', 0)}"
-                    }}]
-                }
-            })
-
-            blocks.append({"type": "divider", "divider": {}})
+    docs = briefing.get("documents") or _EMPTY
+    if "error" not in docs and docs.get("total_pending", 0) > 0:
+        blocks.extend((
+            _h2("📄 Pending Documents"),
+            _para(
+                f"PDFs: {docs.get('pending_pdfs', 0)} | Media: {docs.get('pending_media', 0)} | Review: {docs.get('needs_review', 0)}"
+            ),
+            _DIVIDER,
+        ))
 
     # Financial summary (if available)
-    fin = briefing.get("financial", {})
+    fin = briefing.get("financial") or _EMPTY
     if "error" not in fin and fin.get("net_worth"):
-        blocks.append({
-            "type": "heading_2",
-            "heading_2": {
-                "rich_text": [{"type": "text", "text": {"content": "💰 Financial Summary"}}]
-            }
-        })
-
-        blocks.append({
-            "type": "paragraph",
-            "paragraph": {
-                "rich_text": [{"type": "text", "text": {
-                    "content": f"Net Worth: ${fin.get('net_worth', 0):,.2f}"
-                }}]
-            }
-        })
-
-        blocks.append({
-            "type": "paragraph",
-            "paragraph": {
-                "rich_text": [{"type": "text", "text": {
-                    "content": f"MTD: +${fin.get('mtd_income', 0):,.2f} income | -${abs(fin.get('mtd_expenses', 0)):,.2f} expenses"
-                }}]
-            }
-        })
+        blocks.extend((
+            _h2("💰 Financial Summary"),
+            _para(f"Net Worth: ${fin.get('net_worth', 0):,.2f}"),
+            _para(
+                f"MTD: +${fin.get('mtd_income', 0):,.2f} income | -${abs(fin.get('mtd_expenses', 0)):,.2f} expenses"
+            ),
+        ))
 
     # Automation requests
-    auto = briefing.get("automation", {})
+    auto = briefing.get("automation") or _EMPTY
     if "error" not in auto and auto.get("pending_count", 0) > 0:
-        blocks.append({
-            "type": "heading_2",
-            "heading_2": {
-                "rich_text": [{"type": "text", "text": {"content": "🤖 Pending Automation"}}]
-            }
-        })
-
-        for req in auto.get("requests", [])[:5]:
-            blocks.append({
-                "type": "bulleted_list_item",
-                "bulleted_list_item": {
-                    "rich_text": [{"type": "text", "text": {
-                        "content": f"{req.get('name', 'Unnamed')}: {req.get('command', '')} {req.get('arguments', '')}"
-                    }}]
-                }
-            })
+        blocks.append(_h2("🤖 Pending Automation"))
+        blocks.extend(
+            _bullet(f"{req.get('name', 'Unnamed')}: {req.get('command', '')} {req.get('arguments', '')}")
+            for req in auto.get("requests", [])[:5]
+        )
 
     return blocks
 
@@ -776,7 +1102,11 @@ def main():
 
     # Output
     if args.json:
-        print(json.dumps(briefing, indent=2, default=str))
+        if orjson is not None:
+            sys.stdout.buffer.write(orjson.dumps(briefing, option=orjson.OPT_INDENT_2, default=str))
+            sys.stdout.buffer.write(b"\n")
+        else:
+            print(json.dumps(briefing, indent=2, default=str))
     elif args.quiet:
         print(briefing.get("summary", ""))
     else:
@@ -21,17 +21,25 @@ Usage:
 """
 
 import asyncio
+import functools
 import json
 import logging
 import os
+import sqlite3
 import sys
+from dataclasses import dataclass
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Dict, FrozenSet, List, Optional
 
 # Add parent paths for imports
 sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent / "monarch-mcp-server/src"))
 
+try:
+    import orjson
+except ImportError:  # Optional speedup; fall back to stdlib json
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 # =============================================================================
@@ -44,6 +52,30 @@ HOME = Path.home()
 NOTION_TOKEN_ENV = "NOTION_TOKEN"
 TREEHOUSE_TRANSACTIONS_DB = "7a8ec1ed-6ea0-4b5b-882d-f65320e8a745"
 
+# Notion REST API
+NOTION_API_URL = "https://api.notion.com/v1"
+NOTION_HEADERS = {
+    "Content-Type": "application/json",
+    "Notion-Version": "2022-06-28",
+}
+
+# Concurrent Notion page creations (Notion allows ~3 requests/second)
+NOTION_MAX_CONCURRENCY = 3
+
+# Retries for rate-limited (429) Notion requests
+NOTION_MAX_RETRIES = 3
+
+# Transactions fetched per Monarch API page
+MONARCH_PAGE_SIZE = 100
+
+# Max Monarch IDs checked per Notion "or" filter when deduplicating
+MONARCH_ID_FILTER_BATCH = 100
+
+# Local record of Monarch IDs already synced, so repeat runs skip Notion lookups.
+# Entries are only dropped by a refresh (refresh_id_cache / --refresh-id-cache),
+# e.g. after deleting pages in Notion so those transactions sync again.
+SYNCED_IDS_DB = HOME / "Library/Caches/ecosystem-mcp-server/monarch_ids.db"
+
 # Entity mapping (Monarch account → Business entity)
 # You can customize this based on your account names
 ENTITY_MAPPING = {
@@ -67,137 +99,273 @@ CATEGORY_MAPPING = {
 }
 
 
+class _DefaultingDict(dict):
+    """Dict that returns a fixed default for missing keys in one lookup."""
+
+    def __init__(self, mapping: Dict[str, str], default: str):
+        super().__init__(mapping)
+        self._default = default
+
+    def __missing__(self, key: str) -> str:
+        return self._default
+
+
+# Lookup tables built once at import from the mappings above
+ENTITY_MAP = _DefaultingDict(ENTITY_MAPPING, ENTITY_MAPPING.get("default", ""))
+CATEGORY_MAP = _DefaultingDict(CATEGORY_MAPPING, CATEGORY_MAPPING.get("default", "Other"))
+
+
 # =============================================================================
 # Notion Client
 # =============================================================================
 
+def _json_loads(data):
+    """Parse JSON from str or bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(obj) -> bytes:
+    """Serialize a request body to JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode()
+
+
 def get_notion_token() -> Optional[str]:
-    """Get Notion API token from environment or config file."""
-    token = os.environ.get(NOTION_TOKEN_ENV)
-    if token:
-        return token
-
-    # Try loading from ecosystem.env
-    env_file = HOME / "scripts/ecosystem.env"
-    if env_file.exists():
-        with open(env_file) as f:
-            for line in f:
-                if line.startswith("NOTION_TOKEN="):
-                    return line.split("=", 1)[1].strip().strip('"').strip("'")
+    """Get Notion API token from the environment or ecosystem.env."""
+    return (
+        os.environ.get(NOTION_TOKEN_ENV)
+        or _get_notion_control().read_env_file().get(NOTION_TOKEN_ENV)
+    )
 
-    return None
 
+def notion_session(token: str):
+    """
+    Create an aiohttp session preconfigured with Notion auth headers.
 
-async def create_notion_page(token: str, database_id: str, properties: Dict[str, Any]) -> Dict[str, Any]:
-    """Create a page in a Notion database."""
+    Share one session across calls so they reuse pooled keep-alive connections
+    instead of paying a TCP+TLS handshake per request.
+    """
     import aiohttp
 
-    url = "https://api.notion.com/v1/pages"
-    headers = {
-        "Authorization": f"Bearer {token}",
-        "Content-Type": "application/json",
-        "Notion-Version": "2022-06-28"
-    }
+    return aiohttp.ClientSession(headers={**NOTION_HEADERS, "Authorization": f"Bearer {token}"})
+
+
+# Sessions kept open between syncs, keyed by token, as (event loop, session).
+# A session is bound to the loop that created it; the MCP server runs every
+# sync on the same loop, so repeat syncs skip the TCP+TLS handshake.
+_NOTION_SESSIONS: Dict[str, tuple] = {}
+
+
+def shared_notion_session(token: str):
+    """Return a Notion session for the running loop, reused across syncs."""
+    loop = asyncio.get_running_loop()
+    entry = _NOTION_SESSIONS.get(token)
+    if entry is not None:
+        session_loop, session = entry
+        if session_loop is loop and not session.closed:
+            return session
+
+    session = notion_session(token)
+    _NOTION_SESSIONS[token] = (loop, session)
+    return session
+
+
+async def close_notion_sessions() -> None:
+    """Close the shared sessions created on the running loop."""
+    loop = asyncio.get_running_loop()
+    for token, (session_loop, session) in list(_NOTION_SESSIONS.items()):
+        if session_loop is loop:
+            del _NOTION_SESSIONS[token]
+            await session.close()
+
+
+@functools.lru_cache(maxsize=1)
+def _get_notion_control():
+    """Return the notion_control module (imported on first use)."""
+    from . import notion_control
+    return notion_control
+
+
+async def _acquire_notion_slot() -> None:
+    """
+    Wait for a token from notion_control's process-wide Notion rate limiter.
+
+    The semaphore in sync_transactions only caps concurrency; this keeps the
+    request rate within Notion's limit, shared with the other Notion tools.
+    """
+    await asyncio.to_thread(_get_notion_control().acquire_rate_slot)
+
+
+async def create_notion_page(
+    token: str,
+    database_id: str,
+    properties: Dict[str, Any],
+    session=None,
+) -> Dict[str, Any]:
+    """Create a page in a Notion database, optionally on a shared session."""
+    url = f"{NOTION_API_URL}/pages"
 
     body = {
         "parent": {"database_id": database_id},
         "properties": properties
     }
 
-    async with aiohttp.ClientSession() as session:
-        async with session.post(url, headers=headers, json=body) as resp:
-            if resp.status != 200:
-                error_text = await resp.text()
-                raise Exception(f"Notion API error {resp.status}: {error_text}")
-            return await resp.json()
+    own_session = session is None
+    if own_session:
+        session = notion_session(token)
 
+    try:
+        for attempt in range(NOTION_MAX_RETRIES + 1):
+            await _acquire_notion_slot()
+            async with session.post(url, data=_json_dumps(body)) as resp:
+                # Back off on rate limiting, honoring Retry-After when given
+                if resp.status == 429 and attempt < NOTION_MAX_RETRIES:
+                    retry_after = resp.headers.get("Retry-After")
+                    delay = float(retry_after) if retry_after else 2 ** attempt
+                    logger.warning(f"Notion rate limited, retrying in {delay:.1f}s")
+                    await asyncio.sleep(delay)
+                    continue
 
-async def query_notion_database(
+                if resp.status != 200:
+                    error_text = await resp.text()
+                    raise Exception(f"Notion API error {resp.status}: {error_text}")
+                return await resp.json()
+    finally:
+        if own_session:
+            await session.close()
+
+
+async def iter_notion_database(
     token: str,
     database_id: str,
-    filter_dict: Optional[Dict] = None
-) -> List[Dict]:
-    """Query a Notion database with optional filter."""
-    import aiohttp
-
-    url = f"https://api.notion.com/v1/databases/{database_id}/query"
-    headers = {
-        "Authorization": f"Bearer {token}",
-        "Content-Type": "application/json",
-        "Notion-Version": "2022-06-28"
-    }
+    filter_dict: Optional[Dict] = None,
+    session=None,
+) -> AsyncIterator[Dict]:
+    """Yield pages from a Notion database query one at a time across all result pages."""
+    url = f"{NOTION_API_URL}/databases/{database_id}/query"
 
     body = {}
     if filter_dict:
         body["filter"] = filter_dict
 
-    results = []
     has_more = True
     start_cursor = None
 
-    async with aiohttp.ClientSession() as session:
+    own_session = session is None
+    if own_session:
+        session = notion_session(token)
+
+    try:
         while has_more:
             if start_cursor:
                 body["start_cursor"] = start_cursor
 
-            async with session.post(url, headers=headers, json=body) as resp:
+            await _acquire_notion_slot()
+            async with session.post(url, data=_json_dumps(body)) as resp:
                 if resp.status != 200:
                     error_text = await resp.text()
                     raise Exception(f"Notion API error {resp.status}: {error_text}")
 
-                data = await resp.json()
-                results.extend(data.get("results", []))
-                has_more = data.get("has_more", False)
-                start_cursor = data.get("next_cursor")
+                data = _json_loads(await resp.read())
+
+            has_more = data.get("has_more", False)
+            start_cursor = data.get("next_cursor")
+            for page in data.get("results", []):
+                yield page
+    finally:
+        if own_session:
+            await session.close()
+
 
-    return results
+async def query_notion_database(
+    token: str,
+    database_id: str,
+    filter_dict: Optional[Dict] = None,
+    session=None,
+) -> List[Dict]:
+    """Query a Notion database with optional filter, optionally on a shared session."""
+    return [page async for page in iter_notion_database(token, database_id, filter_dict, session)]
 
 
 # =============================================================================
 # Monarch Client
 # =============================================================================
 
-async def get_monarch_transactions(
+async def iter_monarch_transactions(
     start_date: str,
     end_date: str,
-    limit: int = 500
-) -> List[Dict]:
+    page_size: int = MONARCH_PAGE_SIZE,
+) -> AsyncIterator[Dict]:
     """
-    Get transactions from Monarch Money.
+    Yield transactions from Monarch Money, fetching one page at a time.
 
     Args:
         start_date: Start date in YYYY-MM-DD format
         end_date: End date in YYYY-MM-DD format
-        limit: Maximum number of transactions to retrieve
+        page_size: Number of transactions requested per page
 
-    Returns:
-        List of transaction dictionaries
+    Yields:
+        Transaction dictionaries
     """
-    try:
-        # Try to import from monarch-mcp-server
-        from monarchmoney import MonarchMoney
+    # Try to import from monarch-mcp-server
+    from monarchmoney import MonarchMoney
 
-        # Get session file path
-        session_file = HOME / "Library/Application Support/monarch-mcp-server/mm_session.pickle"
+    # Get session file path
+    session_file = HOME / "Library/Application Support/monarch-mcp-server/mm_session.pickle"
 
-        if not session_file.exists():
-            # Try alternate location
-            session_file = HOME / ".monarch-mcp/session.json"
+    if not session_file.exists():
+        # Try alternate location
+        session_file = HOME / ".monarch-mcp/session.json"
 
-        client = MonarchMoney(session_file=str(session_file), timeout=30)
+    client = MonarchMoney(session_file=str(session_file), timeout=30)
 
-        # Login using saved session
-        await client.login(use_saved_session=True)
+    # Login using saved session
+    await client.login(use_saved_session=True)
 
-        # Get transactions
+    offset = 0
+    while True:
         response = await client.get_transactions(
-            limit=limit,
+            limit=page_size,
+            offset=offset,
             start_date=start_date,
             end_date=end_date
         )
 
         # Extract transactions from response
-        transactions = response.get("allTransactions", {}).get("results", [])
+        batch = response.get("allTransactions", {}).get("results", [])
+        for tx in batch:
+            yield tx
+
+        if len(batch) < page_size:
+            break
+        offset += page_size
+
+
+async def get_monarch_transactions(
+    start_date: str,
+    end_date: str,
+    limit: Optional[int] = None
+) -> List[Dict]:
+    """
+    Get transactions from Monarch Money.
+
+    Args:
+        start_date: Start date in YYYY-MM-DD format
+        end_date: End date in YYYY-MM-DD format
+        limit: Maximum number of transactions to retrieve (default: all in range)
+
+    Returns:
+        List of transaction dictionaries
+    """
+    transactions = []
+    try:
+        async for tx in iter_monarch_transactions(start_date, end_date):
+            transactions.append(tx)
+            if limit is not None and len(transactions) >= limit:
+                break
 
         return transactions
 
@@ -213,50 +381,71 @@ async def get_monarch_transactions(
 # Transaction Mapping
 # =============================================================================
 
-def map_transaction_to_notion(tx: Dict) -> Dict[str, Any]:
+@dataclass(frozen=True, slots=True)
+class Tx:
+    """A Monarch transaction, flattened to the fields the sync uses."""
+
+    id: str
+    date: str
+    amount: float
+    description: str
+    plaid_name: str
+    original_description: str
+    merchant: str
+    category: str
+    account: str
+    pending: bool
+    tags: FrozenSet[str]
+
+    @classmethod
+    def from_monarch(cls, tx: Dict) -> "Tx":
+        """Convert a raw Monarch transaction dictionary."""
+        account = tx.get("account") or {}
+        return cls(
+            id=tx.get("id") or "",
+            date=tx.get("date") or "",
+            amount=float(tx.get("amount") or 0),
+            description=tx.get("description") or "",
+            plaid_name=tx.get("plaidName") or "",
+            original_description=tx.get("originalDescription") or "",
+            merchant=(tx.get("merchant") or {}).get("name") or "",
+            category=(tx.get("category") or {}).get("name") or "",
+            account=account.get("displayName") or account.get("name") or "",
+            pending=bool(tx.get("pending", False)),
+            tags=frozenset(t.get("name", "") for t in tx.get("tags") or ()),
+        )
+
+
+def map_transaction_to_notion(tx: Tx) -> Dict[str, Any]:
     """
     Map a Monarch transaction to Notion page properties.
 
     Args:
-        tx: Monarch transaction dictionary
+        tx: Monarch transaction (see Tx.from_monarch)
 
     Returns:
         Notion properties dictionary
     """
-    # Extract fields from Monarch transaction
-    tx_id = tx.get("id", "")
-    date = tx.get("date", "")
-    amount = float(tx.get("amount", 0))
     # plaidName contains the original transaction description from the bank
-    description = tx.get("plaidName", "") or tx.get("description", "") or tx.get("originalDescription", "")
-    merchant = tx.get("merchant", {}).get("name", "") if tx.get("merchant") else ""
-    category = tx.get("category", {}).get("name", "") if tx.get("category") else ""
-    account_name = tx.get("account", {}).get("displayName", "") or tx.get("account", {}).get("name", "")
-    is_pending = tx.get("pending", False)
-
-    # Determine entity based on account
-    entity = ENTITY_MAPPING.get(account_name, ENTITY_MAPPING.get("default", ""))
-
-    # Map category
-    notion_category = CATEGORY_MAPPING.get(category, CATEGORY_MAPPING.get("default", "Other"))
+    description = tx.plaid_name or tx.description or tx.original_description
 
     # Build Notion properties matching Treehouse Transactions database schema
     # Title field is "Description" (the transaction description)
     # Use merchant name or plaidName for the title
-    title_text = merchant if merchant else description
+    title_text = tx.merchant or description
 
     properties = {
         "Description": {
             "title": [{"text": {"content": title_text[:100]}}]
         },
         "Date": {
-            "date": {"start": date}
+            "date": {"start": tx.date}
         },
         "Amount": {
-            "number": amount
+            "number": tx.amount
         },
         "Monarch ID": {
-            "rich_text": [{"text": {"content": tx_id}}]
+            "rich_text": [{"text": {"content": tx.id}}]
         },
     }
 
@@ -267,15 +456,13 @@ def map_transaction_to_notion(tx: Dict) -> Dict[str, Any]:
         }
 
     # Add category if available
-    if category:
-        properties["Category"] = {"select": {"name": notion_category}}
+    if tx.category:
+        properties["Category"] = {"select": {"name": CATEGORY_MAP[tx.category]}}
 
     # Add entity based on account tags (TH = Treehouse, PERS = Personal)
-    tags = tx.get("tags", [])
-    tag_names = [t.get("name", "") for t in tags]
-    if "TH" in tag_names:
+    if "TH" in tx.tags:
         properties["Entity"] = {"select": {"name": "Treehouse LLC"}}
-    elif "PERS" in tag_names:
+    elif "PERS" in tx.tags:
         properties["Entity"] = {"select": {"name": "Personal"}}
 
     return properties
@@ -285,25 +472,124 @@ def map_transaction_to_notion(tx: Dict) -> Dict[str, Any]:
 # Sync Logic
 # =============================================================================
 
-async def get_existing_monarch_ids(token: str, database_id: str) -> set:
-    """Get set of Monarch IDs already in Notion to prevent duplicates."""
-    existing_ids = set()
+def _extract_monarch_id(page: Dict) -> Optional[str]:
+    """Return the Monarch ID stored on a Notion transaction page, if any."""
+    monarch_id_prop = page.get("properties", {}).get("Monarch ID", {})
+
+    # Handle rich_text property type
+    if monarch_id_prop.get("type") == "rich_text":
+        texts = monarch_id_prop.get("rich_text", [])
+        if texts:
+            return texts[0].get("text", {}).get("content", "")
+    return None
+
+
+def _open_synced_ids_db() -> sqlite3.Connection:
+    """Open the synced Monarch ID cache, creating it if needed."""
+    SYNCED_IDS_DB.parent.mkdir(parents=True, exist_ok=True)
+
+    conn = sqlite3.connect(str(SYNCED_IDS_DB))
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS synced_ids (
+            database_id TEXT NOT NULL,
+            monarch_id TEXT NOT NULL,
+            PRIMARY KEY (database_id, monarch_id)
+        )
+    """)
+    return conn
 
+
+def load_synced_ids(database_id: str) -> set:
+    """Return Monarch IDs previously recorded as synced to a Notion database."""
+    try:
+        conn = _open_synced_ids_db()
+        try:
+            rows = conn.execute(
+                "SELECT monarch_id FROM synced_ids WHERE database_id = ?",
+                (database_id,)
+            )
+            return {row[0] for row in rows}
+        finally:
+            conn.close()
+    except sqlite3.Error as e:
+        logger.warning(f"Could not read synced ID cache: {e}")
+        return set()
+
+
+def record_synced_ids(database_id: str, tx_ids) -> None:
+    """Record Monarch IDs that now have a page in the Notion database."""
     try:
-        # Query for pages with Monarch ID property
-        pages = await query_notion_database(token, database_id)
+        conn = _open_synced_ids_db()
+        try:
+            with conn:
+                conn.executemany(
+                    "INSERT OR IGNORE INTO synced_ids (database_id, monarch_id) VALUES (?, ?)",
+                    ((database_id, tx_id) for tx_id in tx_ids if tx_id)
+                )
+        finally:
+            conn.close()
+    except sqlite3.Error as e:
+        logger.warning(f"Could not update synced ID cache: {e}")
+
+
+def forget_synced_ids(database_id: str, tx_ids) -> None:
+    """Drop Monarch IDs from the cache (their Notion pages no longer exist)."""
+    try:
+        conn = _open_synced_ids_db()
+        try:
+            with conn:
+                conn.executemany(
+                    "DELETE FROM synced_ids WHERE database_id = ? AND monarch_id = ?",
+                    ((database_id, tx_id) for tx_id in tx_ids if tx_id)
+                )
+        finally:
+            conn.close()
+    except sqlite3.Error as e:
+        logger.warning(f"Could not update synced ID cache: {e}")
+
+
+async def get_existing_monarch_ids(
+    token: str,
+    database_id: str,
+    tx_ids: List[str],
+    session=None,
+    strict: bool = False,
+) -> set:
+    """
+    Get the subset of Monarch IDs already in Notion to prevent duplicates.
+
+    Only the candidate IDs are looked up (via "Monarch ID" equality filters),
+    so the cost scales with the sync window rather than the database size.
+
+    Args:
+        token: Notion API token
+        database_id: Notion database to check
+        tx_ids: Monarch transaction IDs being synced
+        session: Shared Notion session (see notion_session)
+        strict: Raise on lookup errors instead of returning a partial set
 
-        for page in pages:
-            props = page.get("properties", {})
-            monarch_id_prop = props.get("Monarch ID", {})
+    Returns:
+        Set of IDs from tx_ids that already have a Notion page
+    """
+    existing_ids = set()
 
-            # Handle rich_text property type
-            if monarch_id_prop.get("type") == "rich_text":
-                texts = monarch_id_prop.get("rich_text", [])
-                if texts:
-                    existing_ids.add(texts[0].get("text", {}).get("content", ""))
+    try:
+        for i in range(0, len(tx_ids), MONARCH_ID_FILTER_BATCH):
+            batch = tx_ids[i:i + MONARCH_ID_FILTER_BATCH]
+            filter_dict = {
+                "or": [
+                    {"property": "Monarch ID", "rich_text": {"equals": tx_id}}
+                    for tx_id in batch
+                ]
+            }
+            async for page in iter_notion_database(token, database_id, filter_dict, session):
+                monarch_id = _extract_monarch_id(page)
+                if monarch_id:
+                    existing_ids.add(monarch_id)
 
     except Exception as e:
+        if strict:
+            raise
         logger.warning(f"Could not fetch existing Monarch IDs: {e}")
 
     return existing_ids
@@ -312,7 +598,9 @@ async def get_existing_monarch_ids(token: str, database_id: str) -> set:
 async def sync_transactions(
     days: int = 7,
     dry_run: bool = False,
-    database_id: Optional[str] = None
+    database_id: Optional[str] = None,
+    check_duplicates: bool = False,
+    refresh_id_cache: bool = False,
 ) -> Dict[str, Any]:
     """
     Sync transactions from Monarch to Notion.
@@ -321,6 +609,11 @@ async def sync_transactions(
         days: Number of days to sync (default: 7)
         dry_run: If True, don't actually create pages in Notion
         database_id: Override default database ID
+        check_duplicates: In dry-run mode, still look up existing pages so
+            duplicates are reported as skipped (always done for real syncs)
+        refresh_id_cache: Look up every transaction in Notion instead of
+            trusting the local synced-ID cache, and drop cached IDs whose
+            pages are gone so they sync again
 
     Returns:
         Summary of sync operation
@@ -357,48 +650,95 @@ async def sync_transactions(
 
     logger.info(f"Retrieved {len(transactions)} transactions from Monarch")
 
-    # Get existing Monarch IDs to prevent duplicates
-    existing_ids = await get_existing_monarch_ids(token, db_id)
-    logger.info(f"Found {len(existing_ids)} existing transactions in Notion")
-
-    # Process each transaction
-    for tx in transactions:
-        tx_id = tx.get("id", "")
-
+    # Flatten once so mapping and reporting use attribute access
+    txs = [Tx.from_monarch(tx) for tx in transactions]
+
+    # One session for all Notion calls (kept open for later syncs) so requests
+    # share pooled connections
+    session = shared_notion_session(token)
+
+    # Get existing Monarch IDs to prevent duplicates. IDs synced on earlier
+    # runs come from the local cache; only the rest are looked up in Notion.
+    # Dry runs skip the lookup unless asked, since nothing gets created.
+    if dry_run and not check_duplicates and not refresh_id_cache:
+        existing_ids = set()
+    else:
+        # The ID cache is SQLite; keep its blocking I/O off the event loop
+        synced_ids = set() if refresh_id_cache else await asyncio.to_thread(load_synced_ids, db_id)
+        tx_ids = [tx.id for tx in txs if tx.id and tx.id not in synced_ids]
+        try:
+            # A refresh must not trust a partial lookup, or it would forget
+            # IDs that still have pages and create duplicates
+            found_ids = await get_existing_monarch_ids(
+                token, db_id, tx_ids, session=session, strict=refresh_id_cache
+            ) if tx_ids else set()
+        except Exception as e:
+            result["error"] = f"Could not refresh synced ID cache: {e}"
+            return result
+        if refresh_id_cache:
+            await asyncio.to_thread(
+                forget_synced_ids, db_id, [tx_id for tx_id in tx_ids if tx_id not in found_ids]
+            )
+        if found_ids:
+            await asyncio.to_thread(record_synced_ids, db_id, found_ids)
+        existing_ids = synced_ids | found_ids
+        logger.info(f"Found {len(existing_ids)} existing transactions in Notion")
+
+    # Skip transactions that already exist and map the rest
+    pending = []
+    for tx in txs:
         # Skip if already exists
-        if tx_id in existing_ids:
+        if tx.id in existing_ids:
             result["skipped"] += 1
             continue
 
         # Map to Notion properties
-        properties = map_transaction_to_notion(tx)
+        pending.append((tx, map_transaction_to_notion(tx)))
 
-        if dry_run:
+    if dry_run:
+        for tx, _ in pending:
             result["transactions"].append({
-                "id": tx_id,
-                "description": tx.get("description", "")[:50],
-                "amount": tx.get("amount"),
-                "date": tx.get("date"),
+                "id": tx.id,
+                "description": tx.description[:50],
+                "amount": tx.amount,
+                "date": tx.date,
                 "action": "would_create"
             })
             result["synced"] += 1
-        else:
-            try:
-                await create_notion_page(token, db_id, properties)
+    else:
+        # Create pages concurrently, bounded to stay under Notion's rate limit
+        semaphore = asyncio.Semaphore(NOTION_MAX_CONCURRENCY)
+
+        async def _create(properties: Dict[str, Any]) -> Dict[str, Any]:
+            async with semaphore:
+                return await create_notion_page(token, db_id, properties, session=session)
+
+        outcomes = await asyncio.gather(
+            *(_create(properties) for _, properties in pending),
+            return_exceptions=True,
+        )
+
+        created_ids = []
+        for (tx, _), outcome in zip(pending, outcomes):
+            tx_id = tx.id
+            if isinstance(outcome, Exception):
+                result["errors"] += 1
+                result["error_details"].append({
+                    "id": tx_id,
+                    "error": str(outcome)
+                })
+                logger.error(f"Failed to create page for {tx_id}: {outcome}")
+            else:
                 result["synced"] += 1
                 result["transactions"].append({
                     "id": tx_id,
-                    "description": tx.get("description", "")[:50],
-                    "amount": tx.get("amount"),
+                    "description": tx.description[:50],
+                    "amount": tx.amount,
                     "action": "created"
                 })
-            except Exception as e:
-                result["errors"] += 1
-                result["error_details"].append({
-                    "id": tx_id,
-                    "error": str(e)
-                })
-                logger.error(f"Failed to create page for {tx_id}: {e}")
+                created_ids.append(tx_id)
+
+        await asyncio.to_thread(record_synced_ids, db_id, created_ids)
 
     result["success"] = result["errors"] == 0
     result["summary"] = f"Synced {result['synced']}, skipped {result['skipped']} duplicates, {result['errors']} errors"
@@ -416,8 +756,23 @@ def main():
 
     parser = argparse.ArgumentParser(description="Sync Monarch transactions to Notion")
     parser.add_argument("--days", type=int, default=7, help="Number of days to sync")
-    parser.add_argument("--dry-run", action="store_true", help="Preview without creating pages")
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Preview without creating pages (does not check Notion for duplicates; "
+             "use --check-duplicates to include)"
+    )
     parser.add_argument("--database-id", type=str, help="Override Notion database ID")
+    parser.add_argument(
+        "--refresh-id-cache",
+        action="store_true",
+        help="Re-check every transaction in Notion and forget cached IDs whose pages were deleted"
+    )
+    parser.add_argument(
+        "--check-duplicates",
+        action="store_true",
+        help="With --dry-run, look up existing pages and report duplicates as skipped"
+    )
 
     args = parser.parse_args()
 
@@ -426,13 +781,24 @@ def main():
         format="%(asctime)s - %(levelname)s - %(message)s"
     )
 
-    result = asyncio.run(sync_transactions(
-        days=args.days,
-        dry_run=args.dry_run,
-        database_id=args.database_id
-    ))
-
-    print(json.dumps(result, indent=2, default=str))
+    async def _run() -> Dict[str, Any]:
+        try:
+            return await sync_transactions(
+                days=args.days,
+                dry_run=args.dry_run,
+                database_id=args.database_id,
+                check_duplicates=args.check_duplicates,
+                refresh_id_cache=args.refresh_id_cache,
+            )
+        finally:
+            await close_notion_sessions()
+
+    result = asyncio.run(_run())
+
+    if orjson is not None:
+        print(orjson.dumps(result, option=orjson.OPT_INDENT_2, default=str).decode())
+    else:
+        print(json.dumps(result, indent=2, default=str))
 
     return 0 if result.get("success") else 1
 
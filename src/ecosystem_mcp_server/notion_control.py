@@ -14,16 +14,30 @@ Database Schema (Automation Requests):
 - Result (rich_text): Summary of what happened (including errors)
 """
 
+import atexit
+import functools
+import importlib.util
 import json
 import logging
 import os
+import random
+import signal
+import threading
 import time
-from datetime import datetime
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
+import httpx
 from notion_client import Client
-from notion_client.errors import APIResponseError
+from notion_client.errors import APIResponseError, HTTPResponseError, RequestTimeoutError
+
+try:
+    import orjson
+except ImportError:  # Optional speedup; fall back to the SDK's stdlib json
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
@@ -34,47 +48,255 @@ logger = logging.getLogger(__name__)
 # Environment variable for Notion token
 NOTION_TOKEN_ENV = "NOTION_TOKEN"
 
+# Fallback credentials file (KEY=value per line) when the variable isn't set
+ECOSYSTEM_ENV_FILE = Path.home() / "scripts/ecosystem.env"
+
 # Database ID will be stored after creation
 CONFIG_FILE = Path.home() / "Library/Application Support/ecosystem-mcp-server/notion_config.json"
 
+# Touching this file wakes a running poller immediately (requires watchfiles),
+# e.g. from a webhook or `python -m ecosystem_mcp_server.notion_control --wake`
+QUEUE_MARKER = CONFIG_FILE.parent / "notion_queue.touch"
+
 # Status values
 STATUS_QUEUED = "queued"
 STATUS_RUNNING = "running"
 STATUS_DONE = "done"
 STATUS_FAILED = "failed"
 
+# HTTP/2 lets status updates and queries share one TLS connection; it needs
+# the optional h2 package (pip install ecosystem-mcp-server[speedups])
+NOTION_HTTP2 = importlib.util.find_spec("h2") is not None
+# Keep idle connections past the default 60s poll interval so the next poll
+# reuses the TLS session instead of handshaking again
+NOTION_HTTP_LIMITS = httpx.Limits(max_keepalive_connections=4, keepalive_expiry=300)
+
+# Max characters (UTF-16 code units) in one rich_text item
+NOTION_TEXT_LIMIT = 2000
+
+# Rows per database query page (Notion's maximum)
+NOTION_PAGE_SIZE = 100
+
+# Longest wait between polls while the queue stays empty (seconds)
+POLL_MAX_INTERVAL = 900
+
+# Notion's query results lag behind page updates, so a request processed
+# within this window (seconds) may still be listed as queued; such rows are
+# ignored rather than executed again
+PROCESSED_IGNORE_WINDOW = 120
+
+# Notion allows ~3 requests/second per integration; stay safely below it
+NOTION_RATE_LIMIT = 2.5
+NOTION_BURST = 5
+
+# Retries for throttled or transiently failing Notion calls
+NOTION_MAX_ATTEMPTS = 5
+NOTION_RETRY_BASE = 1.0
+NOTION_RETRY_CAP = 30.0
+NOTION_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+# A throttled request was rejected before it took effect, so it is the only
+# failure that is safe to retry for calls that create something
+NOTION_WRITE_RETRY_STATUSES = frozenset({429})
+
+# Requests finishing sooner than this (seconds) skip the "running" status write
+RUNNING_STATUS_DELAY = 0.5
+
+# Identical requests completing within this window (seconds) reuse the result
+RESULT_REUSE_TTL = 30
+RESULT_REUSE_MAX = 32
+
+# Status updates run on one background worker so they overlap with request
+# execution while still reaching Notion in submission order
+_STATUS_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="notion-status")
+
 
 # =============================================================================
 # Notion Client Setup
 # =============================================================================
 
+class TokenBucket:
+    """Thread-safe token bucket that blocks callers to hold a request rate."""
+
+    def __init__(self, rate: float, capacity: int):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Take one token, sleeping until one is available."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+
+            # Reserve the token now (possibly going negative) so concurrent
+            # callers queue up behind each other instead of all waking at once
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0
+
+        if wait:
+            time.sleep(wait)
+
+
+# Shared by every Notion call in the process
+_NOTION_BUCKET = TokenBucket(NOTION_RATE_LIMIT, NOTION_BURST)
+
+
+def acquire_rate_slot():
+    """Block until the process-wide Notion rate limit allows another request."""
+    _NOTION_BUCKET.acquire()
+
+
+def _retry_delay(error: Exception, previous: float) -> float:
+    """Seconds to wait before retrying, honoring Notion's Retry-After header."""
+    retry_after = getattr(error, "headers", {}).get("retry-after")
+    if retry_after:
+        try:
+            return float(retry_after)
+        except ValueError:
+            pass
+
+    # Decorrelated jitter: grows roughly 3x per attempt, capped
+    return min(NOTION_RETRY_CAP, random.uniform(NOTION_RETRY_BASE, previous * 3))
+
+
+def call_notion(func, *args, idempotent: bool = True, **kwargs):
+    """
+    Call a Notion client method, rate limited and retried on transient errors.
+
+    Every attempt takes a token from the process-wide bucket. Rate limiting
+    (429), server errors and timeouts are retried up to NOTION_MAX_ATTEMPTS
+    times; other errors are raised immediately.
+
+    Pass idempotent=False for calls that create pages, databases or blocks:
+    a timeout or server error may come after Notion committed the write, so
+    those calls are only retried when throttled.
+    """
+    retry_statuses = NOTION_RETRY_STATUSES if idempotent else NOTION_WRITE_RETRY_STATUSES
+    delay = NOTION_RETRY_BASE
+    for attempt in range(1, NOTION_MAX_ATTEMPTS + 1):
+        _NOTION_BUCKET.acquire()
+        try:
+            return func(*args, **kwargs)
+        except (HTTPResponseError, RequestTimeoutError) as e:
+            if isinstance(e, RequestTimeoutError):
+                retryable = idempotent
+            else:
+                retryable = getattr(e, "status", None) in retry_statuses
+            if attempt == NOTION_MAX_ATTEMPTS or not retryable:
+                raise
+            delay = _retry_delay(e, delay)
+            logger.warning("Notion request failed (%s); retrying in %.1fs", e, delay)
+            time.sleep(delay)
+
+
+class _OrjsonClient(Client):
+    """Notion client that decodes successful responses with orjson."""
+
+    def _parse_response(self, response):
+        if not response.is_success:
+            # Let the SDK build its APIResponseError/HTTPResponseError
+            return super()._parse_response(response)
+        return orjson.loads(response.content)
+
+
+def _send_raw(client: Client, method: str, path: str, body: bytes) -> Any:
+    """Send a request with an already-serialized JSON body via the client's pool."""
+    try:
+        response = client.client.request(
+            method,
+            path,
+            content=body,
+            headers={"Content-Type": "application/json"},
+        )
+    except httpx.TimeoutException:
+        raise RequestTimeoutError()
+    # Reuse the SDK's response handling so errors raise the usual exceptions
+    return client._parse_response(response)
+
+
+# Clients by token, reused so the SDK's HTTP connection pool survives between polls
+_CLIENTS: Dict[str, Client] = {}
+
+
 def get_notion_client() -> Optional[Client]:
-    """Get authenticated Notion client."""
-    token = os.environ.get(NOTION_TOKEN_ENV)
-    if not token:
-        # Try loading from ecosystem.env
-        env_file = Path.home() / "scripts/ecosystem.env"
-        if env_file.exists():
-            with open(env_file) as f:
-                for line in f:
-                    if line.startswith("NOTION_TOKEN="):
-                        token = line.split("=", 1)[1].strip().strip('"').strip("'")
-                        break
+    """Get authenticated Notion client (shared for the process lifetime)."""
+    token = os.environ.get(NOTION_TOKEN_ENV) or read_env_file().get(NOTION_TOKEN_ENV)
 
     if not token:
-        logger.error(f"Notion token not found. Set {NOTION_TOKEN_ENV} environment variable.")
+        logger.error("Notion token not found. Set %s environment variable.", NOTION_TOKEN_ENV)
         return None
 
-    # Use older API version that supports databases.query
-    return Client(auth=token, notion_version="2022-06-28")
+    client = _CLIENTS.get(token)
+    if client is None:
+        # Use older API version that supports databases.query
+        client_class = Client if orjson is None else _OrjsonClient
+        http_client = httpx.Client(http2=NOTION_HTTP2, limits=NOTION_HTTP_LIMITS)
+        client = _CLIENTS[token] = client_class(
+            auth=token, notion_version="2022-06-28", client=http_client
+        )
+    return client
+
+
+def read_env_file() -> Dict[str, str]:
+    """
+    Return the KEY=value pairs of ECOSYSTEM_ENV_FILE.
+
+    Shared by every module that reads credentials from the file. Keyed by
+    mtime like load_config, so an edited token is picked up on the next call.
+    """
+    try:
+        mtime_ns = ECOSYSTEM_ENV_FILE.stat().st_mtime_ns
+    except OSError:
+        return {}
+    return _parse_env_file(mtime_ns)
+
+
+@functools.lru_cache(maxsize=1)
+def _parse_env_file(mtime_ns: int) -> Dict[str, str]:
+    """Parse the env file (memoized while its mtime is unchanged)."""
+    try:
+        text = ECOSYSTEM_ENV_FILE.read_text()
+    except OSError:
+        return {}
+
+    env = {}
+    for line in text.splitlines():
+        key, sep, value = line.partition("=")
+        key = key.strip()
+        if sep and key and not key.startswith("#"):
+            env[key] = value.strip().strip("\"'")
+    return env
+
+
+@atexit.register
+def _close_clients():
+    """Close pooled HTTP connections on interpreter exit."""
+    for client in _CLIENTS.values():
+        client.close()
+    _CLIENTS.clear()
 
 
 def load_config() -> Dict[str, Any]:
     """Load saved configuration."""
-    if CONFIG_FILE.exists():
-        with open(CONFIG_FILE) as f:
-            return json.load(f)
-    return {}
+    try:
+        mtime_ns = CONFIG_FILE.stat().st_mtime_ns
+    except OSError:
+        return {}
+
+    # Keyed by mtime so edits from another process (e.g. --set-db) are seen.
+    # Return a copy so callers can modify it without touching the cache.
+    return dict(_read_config(mtime_ns))
+
+
+@functools.lru_cache(maxsize=1)
+def _read_config(mtime_ns: int) -> Dict[str, Any]:
+    """Read the config file (memoized while its mtime is unchanged)."""
+    with open(CONFIG_FILE) as f:
+        return json.load(f)
 
 
 def save_config(config: Dict[str, Any]):
@@ -82,6 +304,7 @@ def save_config(config: Dict[str, Any]):
     CONFIG_FILE.parent.mkdir(parents=True, exist_ok=True)
     with open(CONFIG_FILE, "w") as f:
         json.dump(config, f, indent=2)
+    _read_config.cache_clear()
 
 
 # =============================================================================
@@ -107,7 +330,9 @@ def create_automation_requests_database(parent_page_id: str) -> Optional[str]:
 
     try:
         # Create the database with schema matching existing database
-        response = client.databases.create(
+        response = call_notion(
+            client.databases.create,
+            idempotent=False,
             parent={"type": "page_id", "page_id": parent_page_id},
             title=[{"type": "text", "text": {"content": "Automation Requests"}}],
             properties={
@@ -140,7 +365,7 @@ def create_automation_requests_database(parent_page_id: str) -> Optional[str]:
         )
 
         database_id = response["id"]
-        logger.info(f"Created Automation Requests database: {database_id}")
+        logger.info("Created Automation Requests database: %s", database_id)
 
         # Save to config
         config = load_config()
@@ -150,7 +375,7 @@ def create_automation_requests_database(parent_page_id: str) -> Optional[str]:
         return database_id
 
     except APIResponseError as e:
-        logger.error(f"Failed to create database: {e}")
+        logger.error("Failed to create database: %s", e)
         return None
 
 
@@ -158,6 +383,20 @@ def create_automation_requests_database(parent_page_id: str) -> Optional[str]:
 # Request Handling
 # =============================================================================
 
+# Query for queued requests, oldest first
+_PENDING_QUERY = {
+    "filter": {
+        "property": "Status",
+        "select": {"equals": STATUS_QUEUED}
+    },
+    "sorts": [
+        {"property": "Created", "direction": "ascending"}  # created_time type
+    ],
+    "page_size": NOTION_PAGE_SIZE,
+}
+_PENDING_QUERY_BODY = json.dumps(_PENDING_QUERY, separators=(",", ":")).encode()
+
+
 def get_pending_requests() -> List[Dict[str, Any]]:
     """
     Get all queued automation requests.
@@ -175,72 +414,142 @@ def get_pending_requests() -> List[Dict[str, Any]]:
         logger.error("Automation Requests database not configured")
         return []
 
+    requests = []
+    path = f"databases/{db_id}/query"
     try:
-        # Use direct request since library doesn't expose databases.query
-        response = client.request(
-            path=f"databases/{db_id}/query",
-            method="POST",
-            body={
-                "filter": {
-                    "property": "Status",
-                    "select": {"equals": STATUS_QUEUED}
-                },
-                "sorts": [
-                    {"property": "Created", "direction": "ascending"}  # created_time type
-                ]
-            }
-        )
-
-        requests = []
-        for page in response.get("results", []):
-            req = parse_request_page(page)
-            if req:
-                requests.append(req)
+        # Use direct request since library doesn't expose databases.query;
+        # the first page's body is constant and pre-serialized
+        response = call_notion(_send_raw, client, "POST", path, _PENDING_QUERY_BODY)
+
+        # Page through results; Notion returns at most 100 rows per query
+        while True:
+            for page in response.get("results", []):
+                req = parse_request_page(page)
+                if req:
+                    requests.append(req)
+
+            if not response.get("has_more") or not response.get("next_cursor"):
+                break
+            response = call_notion(
+                client.request,
+                path=path,
+                method="POST",
+                body={**_PENDING_QUERY, "start_cursor": response["next_cursor"]},
+            )
 
         return requests
 
     except APIResponseError as e:
-        logger.error(f"Failed to query requests: {e}")
-        return []
+        logger.error("Failed to query requests: %s", e)
+        # Still hand back any pages fetched before the failure
+        return requests
 
 
-def parse_request_page(page: Dict) -> Optional[Dict[str, Any]]:
-    """Parse a Notion page into a request dict."""
+def query_pending_requests(
+    page_size: int = NOTION_PAGE_SIZE,
+    since: Optional[str] = None,
+    start_cursor: Optional[str] = None,
+) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+    """
+    Get one page of queued automation requests.
+
+    Args:
+        page_size: Maximum rows to return (1-100)
+        since: Only include requests edited on or after this ISO 8601 time
+        start_cursor: next_cursor from a previous call, to resume paging
+
+    Returns:
+        Tuple of (pending request objects, cursor for the next page or None)
+    """
+    client = get_notion_client()
+    if not client:
+        return [], None
+
+    config = load_config()
+    db_id = config.get("automation_requests_db_id")
+    if not db_id:
+        logger.error("Automation Requests database not configured")
+        return [], None
+
+    body = {**_PENDING_QUERY, "page_size": max(1, min(page_size, NOTION_PAGE_SIZE))}
+    if since:
+        body["filter"] = {"and": [
+            _PENDING_QUERY["filter"],
+            {"timestamp": "last_edited_time", "last_edited_time": {"on_or_after": since}},
+        ]}
+    if start_cursor:
+        body["start_cursor"] = start_cursor
+
     try:
-        props = page.get("properties", {})
+        response = call_notion(
+            client.request,
+            path=f"databases/{db_id}/query",
+            method="POST",
+            body=body,
+        )
+    except APIResponseError as e:
+        logger.error("Failed to query requests: %s", e)
+        return [], None
 
-        # Extract title (Name property)
-        title_prop = props.get("Name", {}).get("title", [])
-        name = title_prop[0]["text"]["content"] if title_prop else ""
+    requests = [req for req in map(parse_request_page, response.get("results", [])) if req]
+    next_cursor = response.get("next_cursor") if response.get("has_more") else None
+    return requests, next_cursor
 
-        # Extract rich_text values (Command and Arguments)
-        command_prop = props.get("Command", {}).get("rich_text", [])
-        command = command_prop[0]["text"]["content"] if command_prop else ""
 
-        args_prop = props.get("Arguments", {}).get("rich_text", [])
-        arguments = args_prop[0]["text"]["content"] if args_prop else ""
+def _first_text(prop: Optional[Dict], kind: str) -> str:
+    """Return the first text fragment of a title/rich_text property, or ""."""
+    try:
+        return prop[kind][0]["text"]["content"]
+    except (KeyError, IndexError, TypeError):
+        return ""
+
 
-        # Extract status
-        status_prop = props.get("Status", {}).get("select")
-        status_val = status_prop["name"] if status_prop else None
+def parse_request_page(page: Dict) -> Optional[Dict[str, Any]]:
+    """Parse a Notion page into a request dict."""
+    try:
+        props = page.get("properties") or {}
+        get = props.get
 
-        # Extract created_time
-        created_val = props.get("Created", {}).get("created_time")
+        # Extract status and created_time
+        status_prop = (get("Status") or {}).get("select")
+        created_prop = get("Created")
 
         return {
             "id": page["id"],
-            "name": name,
-            "command": command.strip().lower(),
-            "arguments": arguments.strip(),
-            "status": status_val,
-            "created": created_val,
+            "name": _first_text(get("Name"), "title"),
+            "command": _first_text(get("Command"), "rich_text").strip().lower(),
+            "arguments": _first_text(get("Arguments"), "rich_text").strip(),
+            "status": status_prop["name"] if status_prop else None,
+            "created": created_prop.get("created_time") if created_prop else None,
             "url": page.get("url"),
         }
     except Exception as e:
-        logger.error(f"Failed to parse request: {e}")
+        logger.error("Failed to parse request: %s", e)
         return None
 
 
+def _truncate_for_notion(text: str, limit: int = NOTION_TEXT_LIMIT) -> str:
+    """
+    Truncate text to Notion's rich_text limit, which counts UTF-16 code units.
+
+    Characters outside the BMP (most emoji) take two units; slicing the
+    encoded form and dropping a dangling half keeps surrogate pairs intact.
+    """
+    if len(text) <= limit // 2:
+        return text  # Fits even if every character needs two units
+    encoded = text.encode("utf-16-le")
+    if len(encoded) <= limit * 2:
+        return text
+    return encoded[:limit * 2].decode("utf-16-le", "ignore")
+
+
+# Body of the "mark as running" update, serialized once
+_RUNNING_BODY = json.dumps(
+    {"properties": {"Status": {"select": {"name": STATUS_RUNNING}}}},
+    separators=(",", ":"),
+).encode()
+
+
 def update_request_status(
     request_id: str,
     status: str,
@@ -262,28 +571,53 @@ def update_request_status(
         return False
 
     try:
+        if status == STATUS_RUNNING and not result:
+            # Constant body: send the pre-serialized bytes
+            call_notion(_send_raw, client, "PATCH", f"pages/{request_id}", _RUNNING_BODY)
+            return True
+
         properties = {
             "Status": {"select": {"name": status}}
         }
 
         if status in [STATUS_DONE, STATUS_FAILED]:
             properties["Processed"] = {
-                "date": {"start": datetime.now().isoformat()}
+                "date": {"start": datetime.now(timezone.utc).isoformat(timespec="seconds")}
             }
 
         if result:
             properties["Result"] = {
-                "rich_text": [{"text": {"content": result[:2000]}}]  # Notion limit
+                "rich_text": [{"text": {"content": _truncate_for_notion(result)}}]
             }
 
-        client.pages.update(page_id=request_id, properties=properties)
+        call_notion(client.pages.update, page_id=request_id, properties=properties)
         return True
 
     except APIResponseError as e:
-        logger.error(f"Failed to update request: {e}")
+        logger.error("Failed to update request: %s", e)
         return False
 
 
+# =============================================================================
+# Lazy Imports
+# =============================================================================
+# Sibling modules are imported on first use to avoid circular imports with
+# server.py; the results are memoized so repeated calls skip the import machinery.
+
+@functools.lru_cache(maxsize=1)
+def _get_server():
+    """Return the server module."""
+    from . import server
+    return server
+
+
+@functools.lru_cache(maxsize=1)
+def _get_daily_briefing():
+    """Return the daily_briefing module."""
+    from . import daily_briefing
+    return daily_briefing
+
+
 # =============================================================================
 # Request Execution
 # =============================================================================
@@ -302,31 +636,22 @@ def execute_request(request: Dict[str, Any]) -> tuple:
     arguments = request.get("arguments", "")
     name = request.get("name", "")
 
-    logger.info(f"Executing: {name} (command={command}, args={arguments})")
+    logger.info("Executing: %s (command=%s, args=%s)", name, command, arguments)
 
     try:
-        if command == "organize":
-            return execute_organize(arguments)
-        elif command == "extract":
-            return execute_extract()
-        elif command == "sync":
-            return execute_sync(arguments)
-        elif command == "reconcile":
-            return execute_reconcile()
-        elif command == "custom" or not command:
-            return execute_custom(name, arguments)
-        else:
+        handler = _COMMAND_HANDLERS.get(command)
+        if handler is None:
             return False, f"Unknown command: {command}"
+        return handler(name, arguments)
 
     except Exception as e:
-        logger.error(f"Request execution failed: {e}")
+        logger.error("Request execution failed: %s", e)
         return False, f"Error: {e}"
 
 
 def execute_organize(target: str) -> tuple:
     """Execute file organization request."""
-    # Import here to avoid circular imports
-    from . import server
+    server = _get_server()
 
     if target == "tax":
         result = server.organize_downloads("pdf", dry_run=False)
@@ -345,7 +670,7 @@ def execute_organize(target: str) -> tuple:
 
 def execute_extract() -> tuple:
     """Execute tax document extraction."""
-    from . import server
+    server = _get_server()
 
     result = server.extract_tax_documents()
     data = json.loads(result)
@@ -363,7 +688,7 @@ def execute_extract() -> tuple:
 
 def execute_sync(target: str) -> tuple:
     """Execute context sync."""
-    from . import server
+    server = _get_server()
 
     result = server.sync_notion_context()
     data = json.loads(result)
@@ -379,7 +704,7 @@ def execute_sync(target: str) -> tuple:
 
 def execute_reconcile() -> tuple:
     """Execute reconciliation check."""
-    from . import server
+    server = _get_server()
 
     result = server.run_reconciliation()
     data = json.loads(result)
@@ -417,7 +742,7 @@ def execute_custom(request_text: str, arguments: str) -> tuple:
 
 def execute_daily_briefing() -> tuple:
     """Generate and save a daily briefing to Notion."""
-    from . import daily_briefing
+    daily_briefing = _get_daily_briefing()
 
     result = daily_briefing.save_briefing_to_notion()
 
@@ -427,58 +752,285 @@ def execute_daily_briefing() -> tuple:
         return False, f"Failed to save briefing: {result.get('error')}"
 
 
+# Command name -> handler(name, arguments); a blank command is treated as custom
+_COMMAND_HANDLERS = {
+    "organize": lambda name, arguments: execute_organize(arguments),
+    "extract": lambda name, arguments: execute_extract(),
+    "sync": lambda name, arguments: execute_sync(arguments),
+    "reconcile": lambda name, arguments: execute_reconcile(),
+    "custom": execute_custom,
+    "": execute_custom,
+}
+
+
 # =============================================================================
 # Polling Service
 # =============================================================================
 
-def poll_and_process(once: bool = False, interval: int = 60):
+def _next_poll_delay(min_interval: float, max_interval: float, empty_polls: int) -> float:
     """
-    Poll for pending requests and process them.
+    Seconds to wait before the next poll, backing off while the queue is idle.
+
+    The ceiling doubles with each consecutive empty poll (capped at
+    max_interval) and the actual delay is drawn uniformly between
+    min_interval and that ceiling, so pollers don't synchronize.
+    """
+    ceiling = min(max_interval, min_interval * 2 ** empty_polls)
+    return random.uniform(min_interval, max(min_interval, ceiling))
+
+
+# (command, arguments[, name]) -> (monotonic timestamp, result message)
+_RECENT_RESULTS: "OrderedDict[tuple, tuple]" = OrderedDict()
+
+
+def _request_key(request: Dict[str, Any]) -> tuple:
+    """Key identifying requests that would do the same work."""
+    command = request.get("command", "")
+    arguments = request.get("arguments", "")
+    if command in ("custom", ""):
+        # Custom results echo the request name, so only exact repeats match
+        return command, arguments, request.get("name", "")
+    return command, arguments
+
+
+def _recent_result(key: tuple) -> Optional[str]:
+    """Return the result of an identical request that succeeded recently."""
+    now = time.monotonic()
+
+    # Entries are in completion order, so expired ones sit at the front
+    while _RECENT_RESULTS:
+        oldest_key, (completed, _) = next(iter(_RECENT_RESULTS.items()))
+        if now - completed <= RESULT_REUSE_TTL:
+            break
+        del _RECENT_RESULTS[oldest_key]
+
+    entry = _RECENT_RESULTS.get(key)
+    return entry[1] if entry else None
+
+
+def _remember_result(key: tuple, result: str):
+    """Record a successful result for reuse by identical requests."""
+    _RECENT_RESULTS.pop(key, None)
+    _RECENT_RESULTS[key] = (time.monotonic(), result)
+    while len(_RECENT_RESULTS) > RESULT_REUSE_MAX:
+        _RECENT_RESULTS.popitem(last=False)
+
+
+def process_request(
+    request: Dict[str, Any],
+    running_delay: float = RUNNING_STATUS_DELAY,
+    reuse_results: bool = True,
+) -> tuple:
+    """
+    Execute one request and queue its status updates.
+
+    The "running" status is only sent if execution is still going after
+    running_delay seconds, so quick commands cost a single status write.
+    With reuse_results, a request identical to one that succeeded within
+    RESULT_REUSE_TTL seconds (e.g. a double-tapped button) is marked done
+    with that result instead of running again.
 
     Args:
-        once: If True, process once and exit
-        interval: Seconds between polls (default: 60)
+        request: Parsed request (see parse_request_page)
+        running_delay: Seconds a request must run before it is marked running
+        reuse_results: Reuse a recent identical result (the poller does;
+            manual runs should always execute)
+
+    Returns:
+        Tuple of (success, result message, futures for the queued status
+        updates, each resolving to a bool)
     """
-    logger.info(f"Starting Notion Control Plane polling (interval: {interval}s)")
+    req_id = request["id"]
+    updates = []
+
+    # Duplicate of a request that just succeeded: report its result instead
+    key = _request_key(request)
+    cached = _recent_result(key) if reuse_results else None
+    if cached is not None:
+        logger.info("Reusing result of identical request: %s", cached)
+        updates.append(_STATUS_EXECUTOR.submit(update_request_status, req_id, STATUS_DONE, result=cached))
+        return True, cached, updates
+
+    # Mark as running (sent in the background once the delay has passed)
+    timer = threading.Timer(
+        running_delay,
+        lambda: updates.append(_STATUS_EXECUTOR.submit(update_request_status, req_id, STATUS_RUNNING)),
+    )
+    timer.daemon = True
+    timer.start()
+
+    # Execute
+    try:
+        success, result = execute_request(request)
+    finally:
+        # Joining ensures a "running" update is queued before the final one
+        timer.cancel()
+        timer.join()
+
+    # Update status
+    if success:
+        _remember_result(key, result)
+        updates.append(_STATUS_EXECUTOR.submit(update_request_status, req_id, STATUS_DONE, result=result))
+        logger.info("Completed: %s", result)
+    else:
+        updates.append(_STATUS_EXECUTOR.submit(update_request_status, req_id, STATUS_FAILED, result=result))
+        logger.error("Failed: %s", result)
+
+    return success, result, updates
 
-    while True:
+
+# Set to cut a poll-interval wait short (shutdown, reload or wake signal)
+_WAKE = threading.Event()
+_stop_requested = False
+
+
+def _handle_stop(signum, frame):
+    """SIGTERM: finish the current batch, then exit the poll loop."""
+    global _stop_requested
+    _stop_requested = True
+    _WAKE.set()
+
+
+def _handle_reload(signum, frame):
+    """SIGHUP: drop cached config and env, then poll right away."""
+    _read_config.cache_clear()
+    _parse_env_file.cache_clear()
+    _WAKE.set()
+
+
+def _handle_wake(signum, frame):
+    """SIGUSR1: poll right away (e.g. kicked by a webhook receiver)."""
+    _WAKE.set()
+
+
+def install_signal_handlers():
+    """Route SIGTERM/SIGHUP/SIGUSR1 to the poll loop (call from the main thread)."""
+    signal.signal(signal.SIGTERM, _handle_stop)
+    if hasattr(signal, "SIGHUP"):
+        signal.signal(signal.SIGHUP, _handle_reload)
+    if hasattr(signal, "SIGUSR1"):
+        signal.signal(signal.SIGUSR1, _handle_wake)
+
+
+def _start_queue_watcher() -> bool:
+    """
+    Wake the poll loop whenever QUEUE_MARKER is touched.
+
+    Uses watchfiles (FSEvents/inotify) in a daemon thread. The interval-based
+    poll keeps running as a safety net.
+
+    Returns:
+        True if the watcher started, False if watchfiles is not installed
+    """
+    try:
+        from watchfiles import watch
+    except ImportError:
+        return False
+
+    QUEUE_MARKER.parent.mkdir(parents=True, exist_ok=True)
+
+    def _is_marker(change, path: str) -> bool:
+        return Path(path).name == QUEUE_MARKER.name
+
+    def _run():
         try:
-            requests = get_pending_requests()
+            for _ in watch(QUEUE_MARKER.parent, watch_filter=_is_marker, raise_interrupt=False):
+                _WAKE.set()
+        except Exception as e:
+            logger.warning("Queue watcher stopped: %s", e)
 
-            if requests:
-                logger.info(f"Found {len(requests)} pending request(s)")
+    threading.Thread(target=_run, name="notion-queue-watch", daemon=True).start()
+    return True
 
-                for req in requests:
-                    req_id = req["id"]
-                    logger.info(f"Processing: {req['name']} (cmd={req['command']}, args={req['arguments']})")
 
-                    # Mark as running
-                    update_request_status(req_id, STATUS_RUNNING)
+def wake_poller():
+    """Signal a running poller (via QUEUE_MARKER) to check the queue now."""
+    QUEUE_MARKER.parent.mkdir(parents=True, exist_ok=True)
+    QUEUE_MARKER.touch()
 
-                    # Execute
-                    success, result = execute_request(req)
 
-                    # Update status
-                    if success:
-                        update_request_status(req_id, STATUS_DONE, result=result)
-                        logger.info(f"Completed: {result}")
-                    else:
-                        update_request_status(req_id, STATUS_FAILED, result=result)
-                        logger.error(f"Failed: {result}")
+def _wait(seconds: float) -> bool:
+    """Sleep until the next poll or a signal; returns True if asked to stop."""
+    _WAKE.wait(seconds)
+    _WAKE.clear()
+    return _stop_requested
 
-            if once:
-                break
 
-            time.sleep(interval)
+def poll_and_process(
+    once: bool = False,
+    interval: int = 60,
+    max_interval: int = POLL_MAX_INTERVAL,
+    running_delay: float = RUNNING_STATUS_DELAY,
+):
+    """
+    Poll for pending requests and process them.
+
+    Polls every `interval` seconds while requests keep arriving and backs off
+    exponentially (with jitter) up to `max_interval` while the queue is empty.
+    After processing a batch the queue is checked again right away.
+    If watchfiles is installed, touching QUEUE_MARKER also triggers a poll
+    right away.
+
+    Args:
+        once: If True, process once and exit
+        interval: Minimum seconds between polls (default: 60)
+        max_interval: Maximum seconds between polls when idle (default: 900)
+        running_delay: Seconds a request must run before it is marked running
+    """
+    max_interval = max(interval, max_interval)
+    logger.info("Starting Notion Control Plane polling (interval: %s-%ss)", interval, max_interval)
+
+    if not once and _start_queue_watcher():
+        logger.info("Watching %s for new-request notifications", QUEUE_MARKER)
+
+    empty_polls = 0
+    # Page ID -> monotonic time it was processed, whatever the outcome
+    processed: Dict[str, float] = {}
+
+    while not _stop_requested:
+        try:
+            now = time.monotonic()
+            for req_id in [i for i, t in processed.items() if now - t > PROCESSED_IGNORE_WINDOW]:
+                del processed[req_id]
+
+            requests = [req for req in get_pending_requests() if req["id"] not in processed]
+
+            if requests:
+                empty_polls = 0
+                logger.info("Found %d pending request(s)", len(requests))
+
+                updates = []
+                for req in requests:
+                    logger.info("Processing: %s (cmd=%s, args=%s)", req["name"], req["command"], req["arguments"])
+                    updates.extend(process_request(req, running_delay)[2])
+                    processed[req["id"]] = time.monotonic()
+
+                # Wait for the batch's status writes before polling again
+                updated = all([future.result() for future in updates])
+
+                # Re-check immediately for requests queued meanwhile, unless a
+                # status update failed (the same requests would come back).
+                # Stale rows for the requests just handled are skipped above.
+                if updated and not once:
+                    continue
+            else:
+                empty_polls += 1
+
+            if once or _wait(_next_poll_delay(interval, max_interval, empty_polls)):
+                break
 
         except KeyboardInterrupt:
             logger.info("Polling stopped by user")
             break
         except Exception as e:
-            logger.error(f"Polling error: {e}")
+            logger.error("Polling error: %s", e)
             if once:
                 break
-            time.sleep(interval)
+            empty_polls += 1
+            if _wait(_next_poll_delay(interval, max_interval, empty_polls)):
+                break
+
+    logger.info("Notion Control Plane polling stopped")
 
 
 # =============================================================================
@@ -491,9 +1043,16 @@ def main():
 
     parser = argparse.ArgumentParser(description="Notion Control Plane Polling Service")
     parser.add_argument("--once", action="store_true", help="Process once and exit")
-    parser.add_argument("--interval", type=int, default=60, help="Poll interval in seconds")
+    parser.add_argument("--interval", "--min-interval", type=int, default=60,
+                        help="Minimum poll interval in seconds")
+    parser.add_argument("--max-interval", type=int, default=POLL_MAX_INTERVAL,
+                        help="Maximum poll interval in seconds while the queue is empty")
+    parser.add_argument("--rate", type=float, default=NOTION_RATE_LIMIT,
+                        help="Maximum Notion API requests per second")
     parser.add_argument("--create-db", metavar="PAGE_ID", help="Create the database under this page")
     parser.add_argument("--set-db", metavar="DB_ID", help="Set the database ID manually")
+    parser.add_argument("--wake", action="store_true",
+                        help="Tell a running poller to check for requests now")
 
     args = parser.parse_args()
 
@@ -502,6 +1061,12 @@ def main():
         format="%(asctime)s - %(levelname)s - %(message)s"
     )
 
+    _NOTION_BUCKET.rate = args.rate
+
+    if args.wake:
+        wake_poller()
+        return
+
     if args.create_db:
         db_id = create_automation_requests_database(args.create_db)
         if db_id:
@@ -517,7 +1082,8 @@ def main():
         print(f"Database ID saved: {args.set_db}")
         return
 
-    poll_and_process(once=args.once, interval=args.interval)
+    install_signal_handlers()
+    poll_and_process(once=args.once, interval=args.interval, max_interval=args.max_interval)
 
 
 if __name__ == "__main__":
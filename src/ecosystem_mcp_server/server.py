@@ -11,24 +11,53 @@ This MCP server provides unified control over the personal automation ecosystem:
 All operations are logged to SQLite for history tracking.
 """
 
+import atexit
+import functools
 import json
 import logging
 import os
+import re
+import shutil
 import sqlite3
 import subprocess
 import sys
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager, contextmanager
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 from mcp.server.fastmcp import FastMCP
 
+try:
+    import orjson
+except ImportError:  # Optional speedup; fall back to stdlib json
+    orjson = None
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+
+
+@asynccontextmanager
+async def _lifespan(server: FastMCP):
+    """Release resources kept open across tool calls when the server stops."""
+    try:
+        yield
+    finally:
+        # Notion sessions from sync_monarch_to_notion belong to this loop, so
+        # they must be closed before it shuts down
+        monarch_sync = sys.modules.get(f"{__package__}.monarch_sync")
+        if monarch_sync is not None:
+            await monarch_sync.close_notion_sessions()
+
+
 # Initialize FastMCP server
-mcp = FastMCP("Ecosystem MCP Server")
+mcp = FastMCP("Ecosystem MCP Server", lifespan=_lifespan)
 
 # =============================================================================
 # Configuration
@@ -59,6 +88,12 @@ LOGS = {
     "downloads_organizer": HOME / "downloads_organizer.log",
 }
 
+# Extension groups (lowercase) counted as pending files in Downloads
+DOWNLOAD_FILE_GROUPS = {
+    "pdf": frozenset({"pdf"}),
+    "media": frozenset({"jpg", "jpeg", "png", "heic", "mov", "mp4", "mp3", "m4a"}),
+}
+
 # Database for operation history
 DB_PATH = HOME / "Library/Application Support/ecosystem-mcp-server/history.db"
 
@@ -81,14 +116,64 @@ MONARCH_TOKEN_FILE = HOME / ".monarch-mcp/token"
 # Database Setup
 # =============================================================================
 
-def init_database():
-    """Initialize SQLite database for operation history."""
+def _connect() -> sqlite3.Connection:
+    """Open the history database with pragmas tuned for small, frequent writes."""
     DB_PATH.parent.mkdir(parents=True, exist_ok=True)
+    # Shared across MCP worker threads; access is serialized by _DB_LOCK
+    conn = sqlite3.connect(str(DB_PATH), timeout=5, check_same_thread=False)
+    # Per-connection settings; journal_mode=WAL is persisted by _create_schema.
+    # NORMAL is durable across app crashes in WAL mode and skips most fsyncs.
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA busy_timeout=5000")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    # 64 MB page cache (negative = KiB); it persists with the shared connection
+    conn.execute("PRAGMA cache_size=-64000")
+    return conn
+
+
+# One connection for the process lifetime, opened (and the schema created) on
+# first use, so importing this module never touches the database
+_DB_CONN: Optional[sqlite3.Connection] = None
+_DB_LOCK = threading.Lock()
+
+
+@contextmanager
+def _db():
+    """Yield the shared history connection, holding the lock for the block."""
+    global _DB_CONN
+    with _DB_LOCK:
+        if _DB_CONN is None:
+            conn = _connect()
+            _create_schema(conn)
+            _DB_CONN = conn
+        yield _DB_CONN
+
+
+@atexit.register
+def _close_db():
+    """Close the shared history connection on interpreter exit."""
+    global _DB_CONN
+    with _DB_LOCK:
+        if _DB_CONN is not None:
+            _DB_CONN.close()
+            _DB_CONN = None
+
+
+def init_database():
+    """Initialize SQLite database for operation history (otherwise done on first use)."""
+    with _db():
+        pass
 
-    conn = sqlite3.connect(str(DB_PATH))
-    cursor = conn.cursor()
 
-    cursor.execute("""
+def _create_schema(conn: sqlite3.Connection):
+    """Create the history tables and indexes if they don't exist yet."""
+    # Lets pruning hand pages back to the OS; only takes effect before the
+    # database file is first written (existing files keep their mode)
+    conn.execute("PRAGMA auto_vacuum=INCREMENTAL")
+    # WAL lets history reads run alongside log writes
+    conn.execute("PRAGMA journal_mode=WAL")
+
+    conn.execute("""
         CREATE TABLE IF NOT EXISTS operations (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
             timestamp TEXT NOT NULL,
@@ -101,7 +186,7 @@ def init_database():
     """)
 
     # New table for Monarch health check history
-    cursor.execute("""
+    conn.execute("""
         CREATE TABLE IF NOT EXISTS monarch_health_checks (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
             timestamp TEXT NOT NULL,
@@ -115,21 +200,70 @@ def init_database():
         )
     """)
 
+    # History reads are "newest first, within a time window"
+    conn.execute("""
+        CREATE INDEX IF NOT EXISTS idx_operations_timestamp_tool
+        ON operations (timestamp, tool_name)
+    """)
+    conn.execute("""
+        CREATE INDEX IF NOT EXISTS idx_health_checks_timestamp_status
+        ON monarch_health_checks (timestamp, status)
+    """)
+
     conn.commit()
-    conn.close()
+
+
+# History rows waiting to be written, as (insert statement, row) pairs; a
+# background thread flushes them in one transaction every LOG_FLUSH_INTERVAL
+# seconds or LOG_FLUSH_BATCH rows. If the writer falls behind and LOG_QUEUE_MAX
+# rows pile up, the caller flushes them itself instead of growing the queue.
+LOG_FLUSH_INTERVAL = 0.5
+LOG_FLUSH_BATCH = 32
+LOG_QUEUE_MAX = 1000
+_LOG_QUEUE: deque = deque()
+_LOG_WAKE = threading.Event()
+_LOG_THREAD: Optional[threading.Thread] = None
+
+# Monarch health checks are kept for trend analysis over this window; the log
+# writer prunes older rows every HEALTH_CHECK_PRUNE_INTERVAL seconds
+HEALTH_CHECK_RETENTION_DAYS = 90
+HEALTH_CHECK_PRUNE_INTERVAL = 3600
+
+_OPERATION_INSERT = """
+    INSERT INTO operations (timestamp, tool_name, parameters, result, success, duration_ms)
+    VALUES (?, ?, ?, ?, ?, ?)
+"""
+_HEALTH_CHECK_INSERT = """
+    INSERT INTO monarch_health_checks
+    (timestamp, status, session_valid, session_age_days, api_reachable, error_message, library_version, update_available)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+
+def _queue_history_row(statement: str, row: tuple):
+    """Queue a history row and make sure the writer thread is running."""
+    global _LOG_THREAD
+    _LOG_QUEUE.append((statement, row))
+
+    if _LOG_THREAD is None:
+        # Checked again under the lock so concurrent callers start one writer
+        with _DB_LOCK:
+            if _LOG_THREAD is None:
+                _LOG_THREAD = threading.Thread(target=_log_writer, name="history-log-writer", daemon=True)
+                _LOG_THREAD.start()
+
+    queued = len(_LOG_QUEUE)
+    if queued >= LOG_QUEUE_MAX:
+        # Backpressure: write synchronously rather than drop audit rows
+        flush_operation_log()
+    elif queued >= LOG_FLUSH_BATCH:
+        _LOG_WAKE.set()
 
 
 def log_monarch_health_check(health_data: Dict[str, Any]) -> None:
-    """Log a Monarch health check to the database for trend analysis."""
+    """Queue a Monarch health check to be logged for trend analysis."""
     try:
-        conn = sqlite3.connect(str(DB_PATH))
-        cursor = conn.cursor()
-
-        cursor.execute("""
-            INSERT INTO monarch_health_checks
-            (timestamp, status, session_valid, session_age_days, api_reachable, error_message, library_version, update_available)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
+        _queue_history_row(_HEALTH_CHECK_INSERT, (
             datetime.now().isoformat(),
             health_data.get("status", "unknown"),
             1 if health_data.get("session_valid") else 0,
@@ -139,152 +273,506 @@ def log_monarch_health_check(health_data: Dict[str, Any]) -> None:
             health_data.get("library_version"),
             1 if health_data.get("update_available") else 0,
         ))
-
-        conn.commit()
-        conn.close()
     except Exception as e:
         logger.error(f"Failed to log Monarch health check: {e}")
 
 
 def log_operation(tool_name: str, parameters: Dict, result: str, success: bool, duration_ms: int = 0):
-    """Log an operation to the database."""
+    """Queue an operation to be logged to the database."""
     try:
-        conn = sqlite3.connect(str(DB_PATH))
-        cursor = conn.cursor()
-
-        cursor.execute("""
-            INSERT INTO operations (timestamp, tool_name, parameters, result, success, duration_ms)
-            VALUES (?, ?, ?, ?, ?, ?)
-        """, (
+        _queue_history_row(_OPERATION_INSERT, (
             datetime.now().isoformat(),
             tool_name,
-            json.dumps(parameters),
+            _json_dumps(parameters),
             result[:1000] if result else None,  # Truncate long results
             1 if success else 0,
             duration_ms
         ))
-
-        conn.commit()
-        conn.close()
     except Exception as e:
         logger.error(f"Failed to log operation: {e}")
 
 
-# Initialize database on module load
-init_database()
+def flush_operation_log():
+    """Write all queued history rows in a single transaction."""
+    batches: Dict[str, List[tuple]] = {}
+    count = 0
+    while _LOG_QUEUE:
+        statement, row = _LOG_QUEUE.popleft()
+        batches.setdefault(statement, []).append(row)
+        count += 1
+    if not batches:
+        return
+
+    try:
+        with _db() as conn:
+            for statement, rows in batches.items():
+                conn.executemany(statement, rows)
+            conn.commit()
+    except Exception as e:
+        logger.error(f"Failed to log {count} history row(s): {e}")
+
+
+def prune_health_checks(retention_days: int = HEALTH_CHECK_RETENTION_DAYS):
+    """Delete Monarch health checks older than `retention_days` and reclaim space."""
+    cutoff = (datetime.now() - timedelta(days=retention_days)).isoformat()
+    try:
+        with _db() as conn:
+            deleted = conn.execute(
+                "DELETE FROM monarch_health_checks WHERE timestamp < ?", (cutoff,)
+            ).rowcount
+            conn.commit()
+            if deleted:
+                conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+                conn.execute("PRAGMA incremental_vacuum(200)")
+    except Exception as e:
+        logger.error(f"Failed to prune Monarch health checks: {e}")
+
+
+def _log_writer():
+    """Background loop flushing the history log queue and pruning old rows."""
+    last_prune = 0.0
+    while True:
+        _LOG_WAKE.wait(LOG_FLUSH_INTERVAL)
+        _LOG_WAKE.clear()
+        flush_operation_log()
+
+        if time.monotonic() - last_prune >= HEALTH_CHECK_PRUNE_INTERVAL:
+            last_prune = time.monotonic()
+            prune_health_checks()
+
+
+# Registered after _close_db, so it runs first at exit
+atexit.register(flush_operation_log)
 
 
 # =============================================================================
 # Utility Functions
 # =============================================================================
 
-def format_time_ago(dt: datetime) -> str:
-    """Format a datetime as 'X minutes/hours/days ago'."""
-    now = datetime.now()
-    delta = now - dt
+if orjson is not None:
+    # Datetimes pass through to default=str to match the stdlib output
+    _ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+
+# orjson.Fragment was added in orjson 3.9; older versions re-parse instead
+_ORJSON_FRAGMENT = getattr(orjson, "Fragment", None)
+
+
+# Tool responses are read by MCP clients, so they are compact unless
+# ECOSYSTEM_PRETTY_JSON=1 asks for indented output (e.g. while debugging)
+PRETTY_JSON = os.environ.get("ECOSYSTEM_PRETTY_JSON", "0") == "1"
+
+
+def _json_dumps(obj: Any, indent: bool = False) -> str:
+    """
+    Serialize to JSON (orjson when available), stringifying unknown types.
+
+    indent=True marks a tool response; it is only indented when PRETTY_JSON
+    is set.
+    """
+    indent = indent and PRETTY_JSON
+    if orjson is not None:
+        option = _ORJSON_OPTIONS | orjson.OPT_INDENT_2 if indent else _ORJSON_OPTIONS
+        return orjson.dumps(obj, default=str, option=option).decode()
+    return json.dumps(obj, indent=2 if indent else None, default=str)
+
+
+def _json_loads(data):
+    """Parse JSON from str or bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_passthrough(text: str):
+    """Embed already-serialized JSON in a _json_dumps payload without re-parsing it."""
+    if _ORJSON_FRAGMENT is not None:
+        return _ORJSON_FRAGMENT(text)
+    return json.loads(text)
+
+
+def _age_seconds(dt: datetime, now: Optional[float] = None) -> float:
+    """Seconds elapsed since `dt`, measured from `now` (epoch) or the current time."""
+    return (time.time() if now is None else now) - dt.timestamp()
+
+
+def format_time_ago(dt: datetime, now: Optional[float] = None) -> str:
+    """
+    Format a datetime as 'X minutes/hours/days ago'.
+
+    Args:
+        dt: Naive local datetime to describe
+        now: Reference epoch timestamp (defaults to time.time()); pass one
+            shared value to keep several calls consistent
+
+    Returns:
+        Human-readable age string
+    """
+    secs = _age_seconds(dt, now)
 
-    if delta.total_seconds() < 60:
+    if secs < 60:
         return "just now"
-    elif delta.total_seconds() < 3600:
-        mins = int(delta.total_seconds() / 60)
+    elif secs < 3600:
+        mins = int(secs // 60)
         return f"{mins} minute{'s' if mins != 1 else ''} ago"
-    elif delta.total_seconds() < 86400:
-        hours = int(delta.total_seconds() / 3600)
+    elif secs < 86400:
+        hours = int(secs // 3600)
         return f"{hours} hour{'s' if hours != 1 else ''} ago"
     else:
-        days = int(delta.total_seconds() / 86400)
+        days = int(secs // 86400)
         return f"{days} day{'s' if days != 1 else ''} ago"
 
 
+@functools.lru_cache(maxsize=None)
+def _repo_exists(name: str) -> bool:
+    """Check (once per process) whether a configured repository is present."""
+    repo = REPOS.get(name)
+    return repo is not None and repo.exists()
+
+
+def invalidate_repos():
+    """Forget cached repository presence, e.g. after cloning or removing a repo."""
+    _repo_exists.cache_clear()
+
+
+# File mtimes reused for FILE_MTIME_TTL seconds so back-to-back probes of the
+# same file (status polling) skip the stat: path -> (monotonic timestamp, mtime)
+FILE_MTIME_TTL = 1.0
+_MTIME_CACHE: Dict[Path, tuple] = {}
+
+
 def get_file_mtime(path: Path) -> Optional[datetime]:
-    """Get file modification time."""
+    """Get file modification time (None if the file is missing or unreadable)."""
+    now = time.monotonic()
+    cached = _MTIME_CACHE.get(path)
+    if cached and now - cached[0] < FILE_MTIME_TTL:
+        return cached[1]
+
+    try:
+        mtime = datetime.fromtimestamp(os.stat(path).st_mtime)
+    except (OSError, OverflowError, ValueError):
+        mtime = None
+    _MTIME_CACHE[path] = (now, mtime)
+    return mtime
+
+
+# Maps path -> (mtime_ns, size, parsed JSON) for small config/report files
+_JSON_FILE_CACHE: Dict[Path, tuple] = {}
+
+
+def _read_json_cached(path: Path) -> Any:
+    """
+    Parse a JSON file, reusing the previous parse while it is unchanged.
+
+    The returned object is shared between callers and must not be mutated.
+    Raises OSError if the file can't be read and ValueError if it isn't JSON.
+    """
+    st = os.stat(path)
+    cached = _JSON_FILE_CACHE.get(path)
+    if cached and cached[:2] == (st.st_mtime_ns, st.st_size):
+        return cached[2]
+
+    with open(path, "rb") as f:
+        data = _json_loads(f.read())
+    _JSON_FILE_CACHE[path] = (st.st_mtime_ns, st.st_size, data)
+    return data
+
+
+# Maps checkpoint path -> (mtime_ns, size, needs_review count)
+_CHECKPOINT_CACHE: Dict[Path, tuple] = {}
+
+
+def count_needs_review(checkpoint: Path) -> int:
+    """
+    Count checkpoint results flagged for review.
+
+    The count is memoized by file mtime and size, so an unchanged checkpoint
+    is never re-parsed.
+    """
+    try:
+        st = checkpoint.stat()
+    except OSError:
+        return 0
+
+    cached = _CHECKPOINT_CACHE.get(checkpoint)
+    if cached and cached[:2] == (st.st_mtime_ns, st.st_size):
+        return cached[2]
+
     try:
-        if path.exists():
-            return datetime.fromtimestamp(path.stat().st_mtime)
+        with open(checkpoint, "rb") as f:
+            raw = f.read()
+        # A byte scan (in C) settles the common case of nothing flagged
+        # without building a dict for every result
+        if b'"needs_review"' not in raw:
+            needs_review = 0
+        else:
+            results = _json_loads(raw).get("results", [])
+            needs_review = sum(1 for r in results if r.get("needs_review", False))
     except Exception:
-        pass
-    return None
+        return 0
+
+    _CHECKPOINT_CACHE[checkpoint] = (st.st_mtime_ns, st.st_size, needs_review)
+    return needs_review
+
+
+# `launchctl list` snapshot shared by status checks within LAUNCHCTL_CACHE_TTL
+# seconds: (monotonic timestamp, {label: pid or None})
+LAUNCHCTL_CACHE_TTL = 2.0
+_LAUNCHCTL_CACHE: tuple = (0.0, None)
+_LAUNCHCTL_LOCK = threading.Lock()
+# `launchctl list` rows: PID (or "-"), last exit status, label; skips the header
+_LAUNCHCTL_LINE = re.compile(r"^(-|\d+)\s+\S+\s+(.+)$", re.MULTILINE)
+
+
+def _launchctl_snapshot() -> Optional[Dict[str, Optional[int]]]:
+    """Return loaded LaunchAgent labels mapped to their PIDs (None if not running)."""
+    global _LAUNCHCTL_CACHE
+    # Holding the lock across the subprocess lets concurrent checks share one run
+    with _LAUNCHCTL_LOCK:
+        fetched_at, snapshot = _LAUNCHCTL_CACHE
+        if snapshot is not None and time.monotonic() - fetched_at < LAUNCHCTL_CACHE_TTL:
+            return snapshot
+
+        try:
+            result = subprocess.run(
+                ["launchctl", "list"],
+                capture_output=True,
+                text=True,
+                timeout=5
+            )
+        except Exception:
+            return None
+
+        snapshot = {
+            label: int(pid) if pid != "-" else None
+            for pid, label in _LAUNCHCTL_LINE.findall(result.stdout)
+        }
+
+        _LAUNCHCTL_CACHE = (time.monotonic(), snapshot)
+        return snapshot
 
 
 def get_launchctl_status(label: str) -> tuple:
     """Check if a LaunchAgent is loaded and get its PID."""
-    try:
-        result = subprocess.run(
-            ["launchctl", "list"],
-            capture_output=True,
-            text=True,
-            timeout=5
-        )
-        for line in result.stdout.splitlines():
-            if label in line:
-                parts = line.split()
-                if len(parts) >= 2:
-                    pid = parts[0]
-                    if pid != "-" and pid.isdigit():
-                        return True, int(pid)
-                    return True, None
-        return False, None
-    except Exception:
+    snapshot = _launchctl_snapshot()
+    if not snapshot or label not in snapshot:
         return False, None
+    return True, snapshot[label]
 
 
 def count_files_in_downloads(extensions: List[str]) -> int:
     """Count files with given extensions in Downloads."""
+    group = frozenset(ext.lower() for ext in extensions)
+    return count_files_by_extension_groups({"files": group})["files"]
+
+
+def count_files_by_extension_groups(groups: Dict[str, set]) -> Dict[str, int]:
+    """
+    Count Downloads files per extension group in a single directory pass.
+
+    Extensions match case-insensitively. Dotfiles (e.g. macOS "._name.pdf"
+    AppleDouble files) are skipped, as glob("*.ext") would skip them.
+
+    Args:
+        groups: Mapping of group name to a set of lowercase extensions
+
+    Returns:
+        Mapping of group name to matching file count.
+    """
     downloads = HOME / "Downloads"
-    count = 0
+    counts = {name: 0 for name in groups}
     try:
-        for ext in extensions:
-            count += len(list(downloads.glob(f"*.{ext}")))
-            count += len(list(downloads.glob(f"*.{ext.upper()}")))
+        with os.scandir(downloads) as entries:
+            for entry in entries:
+                if entry.name.startswith("."):
+                    continue
+                _, dot, ext = entry.name.rpartition(".")
+                if not dot or not entry.is_file():
+                    continue
+                ext = ext.lower()
+                for name, extensions in groups.items():
+                    if ext in extensions:
+                        counts[name] += 1
     except Exception:
         pass
-    return count
+    return counts
+
+
+def parse_git_status(output: str) -> tuple:
+    """
+    Parse `git status --branch --porcelain=v1` output.
+
+    Args:
+        output: Command stdout
+
+    Returns:
+        Tuple of (branch name or None, has uncommitted changes). A detached
+        HEAD is reported as "HEAD", like `git rev-parse --abbrev-ref HEAD`.
+    """
+    header, _, changes = output.partition("\n")
+    branch = None
+    if header.startswith("## "):
+        head = header[3:]
+        for prefix in ("No commits yet on ", "Initial commit on "):
+            if head.startswith(prefix):
+                head = head[len(prefix):]
+                break
+        if head.startswith("HEAD (no branch)"):
+            branch = "HEAD"
+        else:
+            branch = head.split("...", 1)[0].split(" ", 1)[0]
+    else:
+        changes = output
+    return branch, bool(changes.strip())
+
+
+# Pending-file counts shared by status checks and the daily briefing within
+# DOWNLOADS_CACHE_TTL seconds: (monotonic timestamp, {group: count})
+DOWNLOADS_CACHE_TTL = 5.0
+_DOWNLOADS_CACHE: tuple = (0.0, None)
+_DOWNLOADS_LOCK = threading.Lock()
+
+
+def count_pending_downloads(max_age: float = DOWNLOADS_CACHE_TTL) -> Dict[str, int]:
+    """
+    Count DOWNLOAD_FILE_GROUPS files in Downloads, reusing a recent scan.
+
+    Args:
+        max_age: Oldest cached scan (seconds) to accept; 0 forces a rescan
 
+    Returns:
+        Mapping of group name ("pdf", "media") to file count.
+    """
+    global _DOWNLOADS_CACHE
+    with _DOWNLOADS_LOCK:
+        fetched_at, counts = _DOWNLOADS_CACHE
+        if counts is not None and time.monotonic() - fetched_at < max_age:
+            return counts
+
+        counts = count_files_by_extension_groups(DOWNLOAD_FILE_GROUPS)
+        _DOWNLOADS_CACHE = (time.monotonic(), counts)
+        return counts
+
+
+# Characters of script output kept in tool results
+OUTPUT_TAIL_CHARS = 2000
+
+
+def _read_tail(stream, tail: deque, limit: int):
+    """Drain a text stream, keeping at least its last `limit` characters."""
+    size = 0
+    for chunk in iter(lambda: stream.read(8192), ""):
+        tail.append(chunk)
+        size += len(chunk)
+        while size - len(tail[0]) >= limit:
+            size -= len(tail.popleft())
+
+
+def run_command(
+    cmd: List[str],
+    cwd: Optional[Path] = None,
+    timeout: int = 300,
+    max_output: Optional[int] = None,
+) -> tuple:
+    """
+    Run a command and return (success, stdout, stderr).
+
+    Args:
+        cmd: Command and arguments
+        cwd: Working directory
+        timeout: Seconds before the command is killed
+        max_output: If set, only the last max_output characters of stdout are
+            kept; output is streamed so memory stays bounded however much the
+            command prints
+    """
+    if max_output is None:
+        try:
+            result = subprocess.run(
+                cmd,
+                cwd=str(cwd) if cwd else None,
+                capture_output=True,
+                text=True,
+                timeout=timeout
+            )
+            return result.returncode == 0, result.stdout, result.stderr
+        except subprocess.TimeoutExpired:
+            return False, "", "Command timed out"
+        except Exception as e:
+            return False, "", str(e)
 
-def run_command(cmd: List[str], cwd: Optional[Path] = None, timeout: int = 300) -> tuple:
-    """Run a command and return (success, stdout, stderr)."""
     try:
-        result = subprocess.run(
+        proc = subprocess.Popen(
             cmd,
             cwd=str(cwd) if cwd else None,
-            capture_output=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
             text=True,
-            timeout=timeout
         )
-        return result.returncode == 0, result.stdout, result.stderr
-    except subprocess.TimeoutExpired:
-        return False, "", "Command timed out"
     except Exception as e:
         return False, "", str(e)
 
+    stdout_tail: deque = deque()
+    stderr_parts: List[str] = []
+    readers = [
+        threading.Thread(target=_read_tail, args=(proc.stdout, stdout_tail, max_output), daemon=True),
+        threading.Thread(target=lambda: stderr_parts.append(proc.stderr.read()), daemon=True),
+    ]
+    for reader in readers:
+        reader.start()
+
+    try:
+        proc.wait(timeout=timeout)
+    except subprocess.TimeoutExpired:
+        proc.kill()
+        proc.wait()
+        return False, "", "Command timed out"
+    finally:
+        for reader in readers:
+            reader.join()
+        proc.stdout.close()
+        proc.stderr.close()
+
+    return proc.returncode == 0, "".join(stdout_tail)[-max_output:], "".join(stderr_parts)
+
 
 # =============================================================================
 # Status Checking Functions
 # =============================================================================
 
-def check_downloads_organizer() -> Dict[str, Any]:
-    """Check downloads-organizer status."""
-    status = {
-        "name": "Downloads Organizer",
-        "icon": "📥",
-        "status": "unknown",
+def _new_status(name: str, icon: str, initial: str = "unknown") -> Dict[str, Any]:
+    """Build the common status record every check_* function returns."""
+    return {
+        "name": name,
+        "icon": icon,
+        "status": initial,
         "details": [],
         "attention": [],
     }
 
-    repo = REPOS["downloads_organizer"]
-    if not repo.exists():
+
+def _require_repo(status: Dict[str, Any], name: str) -> Optional[Path]:
+    """Return the repo path, or mark `status` not_installed and return None."""
+    if not _repo_exists(name):
         status["status"] = "not_installed"
         status["details"].append("Repository not found")
+        return None
+    return REPOS[name]
+
+
+def check_downloads_organizer() -> Dict[str, Any]:
+    """Check downloads-organizer status."""
+    status = _new_status("Downloads Organizer", "📥")
+
+    repo = _require_repo(status, "downloads_organizer")
+    if repo is None:
         return status
 
     status["status"] = "installed"
     status["details"].append(f"Location: {repo}")
 
-    # Check pending files
-    pdf_count = count_files_in_downloads(["pdf"])
-    media_exts = ["jpg", "jpeg", "png", "heic", "mov", "mp4", "mp3", "m4a"]
-    media_count = count_files_in_downloads(media_exts)
+    # Check pending files (one directory scan for both groups, shared briefly)
+    counts = count_pending_downloads()
+    pdf_count = counts["pdf"]
+    media_count = counts["media"]
 
     if pdf_count > 0:
         status["attention"].append(f"{pdf_count} PDFs pending")
@@ -299,13 +787,7 @@ def check_downloads_organizer() -> Dict[str, Any]:
 
 def check_tax_organizer() -> Dict[str, Any]:
     """Check tax-pdf-organizer status (legacy)."""
-    status = {
-        "name": "Tax PDF Organizer (Legacy)",
-        "icon": "📁",
-        "status": "unknown",
-        "details": [],
-        "attention": [],
-    }
+    status = _new_status("Tax PDF Organizer (Legacy)", "📁")
 
     # Check LaunchAgents
     watcher_loaded, watcher_pid = get_launchctl_status(LAUNCHAGENTS["tax_watcher"])
@@ -327,22 +809,15 @@ def check_tax_organizer() -> Dict[str, Any]:
     return status
 
 
-def check_monarch_money() -> Dict[str, Any]:
+def check_monarch_money(now: Optional[float] = None) -> Dict[str, Any]:
     """Check Monarch Money MCP Server status using health report file."""
-    status = {
-        "name": "Monarch Money",
-        "icon": "💰",
-        "status": "unknown",
-        "details": [],
-        "attention": [],
-    }
+    status = _new_status("Monarch Money", "💰")
 
     # First, try to read the health report file (proactive monitoring)
     health_report = None
     if MONARCH_HEALTH_REPORT.exists():
         try:
-            with open(MONARCH_HEALTH_REPORT) as f:
-                health_report = json.load(f)
+            health_report = _read_json_cached(MONARCH_HEALTH_REPORT)
         except Exception as e:
             logger.warning(f"Failed to read Monarch health report: {e}")
 
@@ -392,40 +867,37 @@ def check_monarch_money() -> Dict[str, Any]:
             status["last_check"] = health_report["last_check"]
 
     else:
-        # Fallback to legacy session file check
-        has_session = MONARCH_SESSION_FILE.exists() or MONARCH_TOKEN_FILE.exists()
+        # Fallback to legacy session file check; get_file_mtime is a single
+        # stat that returns None for a missing file, so no exists() first
+        session_mtime = get_file_mtime(MONARCH_SESSION_FILE) or get_file_mtime(MONARCH_TOKEN_FILE)
+        legacy_mtime = None if session_mtime else get_file_mtime(MONARCH_SESSION)
 
-        if has_session:
+        if session_mtime:
             # Check session file modification time
-            session_file = MONARCH_SESSION_FILE if MONARCH_SESSION_FILE.exists() else MONARCH_TOKEN_FILE
-            mtime = get_file_mtime(session_file)
-            if mtime:
-                age_days = (datetime.now() - mtime).days
-                status["last_activity"] = mtime.isoformat()
-                status["details"].append(f"Session file: {format_time_ago(mtime)}")
-
-                if age_days > 14:
-                    status["status"] = "likely_expired"
-                    status["attention"].append("Session likely expired (>14 days old)")
-                elif age_days > 10:
-                    status["status"] = "stale"
-                    status["attention"].append("Session may need refresh (>10 days old)")
-                else:
-                    status["status"] = "unknown"
-                    status["details"].append("No health report - status unverified")
-        elif MONARCH_SESSION.exists():
+            age_days = int(_age_seconds(session_mtime, now) // 86400)
+            status["last_activity"] = session_mtime.isoformat()
+            status["details"].append(f"Session file: {format_time_ago(session_mtime, now)}")
+
+            if age_days > 14:
+                status["status"] = "likely_expired"
+                status["attention"].append("Session likely expired (>14 days old)")
+            elif age_days > 10:
+                status["status"] = "stale"
+                status["attention"].append("Session may need refresh (>10 days old)")
+            else:
+                status["status"] = "unknown"
+                status["details"].append("No health report - status unverified")
+        elif legacy_mtime:
             # Legacy pickle session
-            mtime = get_file_mtime(MONARCH_SESSION)
-            if mtime:
-                age_days = (datetime.now() - mtime).days
-                status["last_activity"] = mtime.isoformat()
-                status["details"].append(f"Legacy session: {format_time_ago(mtime)}")
-
-                if age_days > 7:
-                    status["status"] = "stale"
-                    status["attention"].append("Session may need refresh (>7 days old)")
-                else:
-                    status["status"] = "connected"
+            age_days = int(_age_seconds(legacy_mtime, now) // 86400)
+            status["last_activity"] = legacy_mtime.isoformat()
+            status["details"].append(f"Legacy session: {format_time_ago(legacy_mtime, now)}")
+
+            if age_days > 7:
+                status["status"] = "stale"
+                status["attention"].append("Session may need refresh (>7 days old)")
+            else:
+                status["status"] = "connected"
         else:
             status["status"] = "not_authenticated"
             status["attention"].append("Run login_setup.py to authenticate")
@@ -433,20 +905,12 @@ def check_monarch_money() -> Dict[str, Any]:
     return status
 
 
-def check_context_sync() -> Dict[str, Any]:
+def check_context_sync(now: Optional[float] = None) -> Dict[str, Any]:
     """Check treehouse-context-sync status."""
-    status = {
-        "name": "Context Sync",
-        "icon": "🔄",
-        "status": "unknown",
-        "details": [],
-        "attention": [],
-    }
+    status = _new_status("Context Sync", "🔄")
 
-    repo = REPOS["context_sync"]
-    if not repo.exists():
-        status["status"] = "not_installed"
-        status["details"].append("Repository not found")
+    repo = _require_repo(status, "context_sync")
+    if repo is None:
         return status
 
     # Check CHANGELOG.md for last sync
@@ -455,8 +919,8 @@ def check_context_sync() -> Dict[str, Any]:
         mtime = get_file_mtime(changelog)
         if mtime:
             status["last_activity"] = mtime.isoformat()
-            age_hours = (datetime.now() - mtime).total_seconds() / 3600
-            status["details"].append(f"Last sync: {format_time_ago(mtime)}")
+            age_hours = _age_seconds(mtime, now) / 3600
+            status["details"].append(f"Last sync: {format_time_ago(mtime, now)}")
 
             if age_hours > 36:
                 status["status"] = "stale"
@@ -470,20 +934,12 @@ def check_context_sync() -> Dict[str, Any]:
     return status
 
 
-def check_notion_rules() -> Dict[str, Any]:
+def check_notion_rules(now: Optional[float] = None) -> Dict[str, Any]:
     """Check notion-rules (Tax OCR) status."""
-    status = {
-        "name": "Notion Rules (Tax OCR)",
-        "icon": "📄",
-        "status": "idle",
-        "details": [],
-        "attention": [],
-    }
+    status = _new_status("Notion Rules (Tax OCR)", "📄", "idle")
 
-    repo = REPOS["notion_rules"]
-    if not repo.exists():
-        status["status"] = "not_installed"
-        status["details"].append("Repository not found")
+    repo = _require_repo(status, "notion_rules")
+    if repo is None:
         return status
 
     # Check checkpoint file
@@ -492,21 +948,12 @@ def check_notion_rules() -> Dict[str, Any]:
         mtime = get_file_mtime(checkpoint)
         if mtime:
             status["last_activity"] = mtime.isoformat()
-            status["details"].append(f"Last run: {format_time_ago(mtime)}")
+            status["details"].append(f"Last run: {format_time_ago(mtime, now)}")
 
-        # Try to read checkpoint for pending items
-        try:
-            with open(checkpoint) as f:
-                data = json.load(f)
-                if "results" in data:
-                    needs_review = sum(
-                        1 for r in data["results"]
-                        if r.get("needs_review", False)
-                    )
-                    if needs_review > 0:
-                        status["attention"].append(f"{needs_review} documents need review")
-        except Exception:
-            pass
+        # Count pending items (re-parsed only when the checkpoint changes)
+        needs_review = count_needs_review(checkpoint)
+        if needs_review > 0:
+            status["attention"].append(f"{needs_review} documents need review")
 
     return status
 
@@ -515,26 +962,20 @@ def check_notion_rules() -> Dict[str, Any]:
 # New Tool Status Checks (Jan 2026)
 # =============================================================================
 
-def check_notebooklm() -> Dict[str, Any]:
+def check_notebooklm(now: Optional[float] = None) -> Dict[str, Any]:
     """Check NotebookLM MCP status."""
-    status = {
-        "name": "NotebookLM",
-        "icon": "📓",
-        "status": "unknown",
-        "details": [],
-        "attention": [],
-    }
+    status = _new_status("NotebookLM", "📓")
 
     auth_file = HOME / ".notebooklm-mcp/auth.json"
     repo = REPOS.get("notebooklm_mcp")
 
-    if repo and repo.exists():
+    if _repo_exists("notebooklm_mcp"):
         status["details"].append(f"Location: {repo}")
         if auth_file.exists():
             status["status"] = "authenticated"
             mtime = get_file_mtime(auth_file)
             if mtime:
-                status["details"].append(f"Auth: {format_time_ago(mtime)}")
+                status["details"].append(f"Auth: {format_time_ago(mtime, now)}")
         else:
             status["status"] = "not_authenticated"
             status["attention"].append("Run 'uv run notebooklm-mcp auth' to authenticate")
@@ -545,27 +986,21 @@ def check_notebooklm() -> Dict[str, Any]:
     return status
 
 
-def check_google_workspace() -> Dict[str, Any]:
+def check_google_workspace(now: Optional[float] = None) -> Dict[str, Any]:
     """Check Google Workspace MCP status."""
-    status = {
-        "name": "Google Workspace",
-        "icon": "📧",
-        "status": "unknown",
-        "details": [],
-        "attention": [],
-    }
+    status = _new_status("Google Workspace", "📧")
 
     token_file = HOME / ".config/g-workspace-mcp/token.json"
     repo = REPOS.get("google_workspace_mcp")
 
-    if repo and repo.exists():
+    if _repo_exists("google_workspace_mcp"):
         status["details"].append(f"Location: {repo}")
         status["details"].append("Mode: read-only")
         if token_file.exists():
             status["status"] = "connected"
             mtime = get_file_mtime(token_file)
             if mtime:
-                status["details"].append(f"Token: {format_time_ago(mtime)}")
+                status["details"].append(f"Token: {format_time_ago(mtime, now)}")
         else:
             status["status"] = "not_authenticated"
             status["attention"].append("Run OAuth setup to connect Google account")
@@ -576,22 +1011,20 @@ def check_google_workspace() -> Dict[str, Any]:
     return status
 
 
+@functools.lru_cache(maxsize=1)
+def _gemini_path() -> Optional[str]:
+    """Locate the gemini CLI on PATH (once per process; see reset_caches)."""
+    return shutil.which("gemini")
+
+
 def check_ai_code_connect() -> Dict[str, Any]:
     """Check ai-code-connect status."""
-    import shutil
-
-    status = {
-        "name": "AI Code Connect",
-        "icon": "🔄",
-        "status": "unknown",
-        "details": [],
-        "attention": [],
-    }
+    status = _new_status("AI Code Connect", "🔄")
 
     repo = REPOS.get("ai_code_connect")
-    gemini_available = shutil.which("gemini") is not None
+    gemini_available = _gemini_path() is not None
 
-    if repo and repo.exists():
+    if _repo_exists("ai_code_connect"):
         status["details"].append(f"Location: {repo}")
 
         if gemini_available:
@@ -609,13 +1042,7 @@ def check_ai_code_connect() -> Dict[str, Any]:
 
 def check_statusline() -> Dict[str, Any]:
     """Check Claude Code statusline configuration."""
-    status = {
-        "name": "Statusline",
-        "icon": "📊",
-        "status": "unknown",
-        "details": [],
-        "attention": [],
-    }
+    status = _new_status("Statusline", "📊")
 
     script_path = HOME / ".claude/statusline-command.sh"
     settings_path = HOME / ".claude/settings.json"
@@ -627,10 +1054,8 @@ def check_statusline() -> Dict[str, Any]:
         # Check if configured in settings
         if settings_path.exists():
             try:
-                with open(settings_path) as f:
-                    settings = json.load(f)
-                    if "statusLine" in settings:
-                        status["details"].append("Enabled in settings.json")
+                if "statusLine" in _read_json_cached(settings_path):
+                    status["details"].append("Enabled in settings.json")
             except Exception:
                 pass
     else:
@@ -642,16 +1067,10 @@ def check_statusline() -> Dict[str, Any]:
 
 def check_openbb() -> Dict[str, Any]:
     """Check OpenBB financial data platform status."""
-    status = {
-        "name": "OpenBB",
-        "icon": "📈",
-        "status": "unknown",
-        "details": [],
-        "attention": [],
-    }
+    status = _new_status("OpenBB", "📈")
 
     repo = REPOS.get("openbb")
-    if repo and repo.exists():
+    if _repo_exists("openbb"):
         status["details"].append(f"Location: {repo}")
 
     try:
@@ -669,12 +1088,56 @@ def check_openbb() -> Dict[str, Any]:
     return status
 
 
+def reset_caches():
+    """Drop every cached status probe so the next check sees fresh state."""
+    global _LAUNCHCTL_CACHE, _DOWNLOADS_CACHE, _STATUS_CACHE
+    _STATUS_CACHE = (0.0, None)
+    invalidate_repos()
+    _gemini_path.cache_clear()
+    _JSON_FILE_CACHE.clear()
+    _MTIME_CACHE.clear()
+    _CHECKPOINT_CACHE.clear()
+    with _LAUNCHCTL_LOCK:
+        _LAUNCHCTL_CACHE = (0.0, None)
+    with _DOWNLOADS_LOCK:
+        _DOWNLOADS_CACHE = (0.0, None)
+
+
+# Checks reported by get_ecosystem_status, in display order, with whether each
+# accepts the shared reference timestamp
+STATUS_CHECKS = (
+    (check_downloads_organizer, False),
+    (check_tax_organizer, False),
+    (check_monarch_money, True),
+    (check_context_sync, True),
+    (check_notion_rules, True),
+    # New tools (Jan 2026)
+    (check_notebooklm, True),
+    (check_google_workspace, True),
+    (check_ai_code_connect, False),
+    (check_statusline, False),
+    (check_openbb, False),
+)
+
+
+# Status buckets for the get_ecosystem_status summary; anything else counts
+# as not running
+HEALTHY_STATUSES = frozenset({"watching", "connected", "synced", "installed"})
+ATTENTION_STATUSES = frozenset({"stale", "loaded"})
+
+
 # =============================================================================
 # MCP Tools
 # =============================================================================
 
+# Serialized get_ecosystem_status report reused within STATUS_CACHE_TTL
+# seconds: (monotonic timestamp, JSON payload)
+STATUS_CACHE_TTL = 5.0
+_STATUS_CACHE: tuple = (0.0, None)
+
+
 @mcp.tool()
-def get_ecosystem_status() -> str:
+def get_ecosystem_status(force_refresh: bool = False) -> str:
     """
     Get comprehensive status of all automation systems.
 
@@ -689,26 +1152,39 @@ def get_ecosystem_status() -> str:
     - AI Code Connect (NEW)
     - Claude Code Statusline (NEW)
 
-    Also reports pending files and attention items.
+    Also reports pending files and attention items. Results are reused for
+    STATUS_CACHE_TTL seconds.
+
+    Args:
+        force_refresh: If True, ignore cached results and re-probe everything
     """
-    start_time = datetime.now()
+    global _STATUS_CACHE
+    start_ns = time.perf_counter_ns()
+    params = {"force_refresh": force_refresh}
 
     try:
+        if force_refresh:
+            reset_caches()
+        else:
+            cached_at, payload = _STATUS_CACHE
+            if payload is not None and time.monotonic() - cached_at < STATUS_CACHE_TTL:
+                log_operation("get_ecosystem_status", params, "cached", True, 0)
+                return payload
+
+        # One reference timestamp so every "X ago" detail agrees
+        now = time.time()
+
         # Collect all statuses (original + new tools)
-        checks = [
-            check_downloads_organizer(),
-            check_tax_organizer(),
-            check_monarch_money(),
-            check_context_sync(),
-            check_notion_rules(),
-            # New tools (Jan 2026)
-            check_notebooklm(),
-            check_google_workspace(),
-            check_ai_code_connect(),
-            check_statusline(),
-            check_openbb(),
+        probes = [
+            functools.partial(check, now) if timed else check
+            for check, timed in STATUS_CHECKS
         ]
 
+        # Checks are independent and I/O-bound (stat, launchctl), so run them
+        # concurrently; map() keeps results in probe order
+        with ThreadPoolExecutor(max_workers=len(probes)) as executor:
+            checks = list(executor.map(lambda probe: probe(), probes))
+
         # Build result
         result = {
             "timestamp": datetime.now().isoformat(),
@@ -723,28 +1199,41 @@ def get_ecosystem_status() -> str:
         }
 
         # Aggregate attention items and count statuses
+        summary = result["summary"]
         for check in checks:
             for item in check.get("attention", []):
                 result["attention_items"].append(f"{check['icon']} {check['name']}: {item}")
 
             status = check.get("status", "unknown")
-            if status in ["watching", "connected", "synced", "installed"]:
-                result["summary"]["healthy"] += 1
-            elif status in ["stale", "loaded"]:
-                result["summary"]["needs_attention"] += 1
+            if status in HEALTHY_STATUSES:
+                summary["healthy"] += 1
+            elif status in ATTENTION_STATUSES:
+                summary["needs_attention"] += 1
             else:
-                result["summary"]["not_running"] += 1
+                summary["not_running"] += 1
 
         # Log operation
-        duration_ms = int((datetime.now() - start_time).total_seconds() * 1000)
-        log_operation("get_ecosystem_status", {}, json.dumps(result["summary"]), True, duration_ms)
+        duration_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
+        log_operation("get_ecosystem_status", params, _json_dumps(result["summary"]), True, duration_ms)
 
-        return json.dumps(result, indent=2, default=str)
+        payload = _json_dumps(result, indent=True)
+        _STATUS_CACHE = (time.monotonic(), payload)
+        return payload
 
     except Exception as e:
         error_msg = f"Error getting ecosystem status: {str(e)}"
-        log_operation("get_ecosystem_status", {}, error_msg, False)
-        return json.dumps({"error": error_msg})
+        log_operation("get_ecosystem_status", params, error_msg, False)
+        return _json_dumps({"error": error_msg})
+
+
+# History queries are kept as constants so the shared connection's statement
+# cache reuses the compiled queries across calls
+_HISTORY_QUERY = """
+    SELECT timestamp, tool_name, parameters, result, success, duration_ms
+    FROM operations
+    ORDER BY timestamp DESC
+    LIMIT ?
+"""
 
 
 @mcp.tool()
@@ -758,34 +1247,28 @@ def get_automation_history(limit: int = 20) -> str:
     Returns log of recent tool invocations with results.
     """
     try:
-        conn = sqlite3.connect(str(DB_PATH))
-        cursor = conn.cursor()
-
-        cursor.execute("""
-            SELECT timestamp, tool_name, parameters, result, success, duration_ms
-            FROM operations
-            ORDER BY timestamp DESC
-            LIMIT ?
-        """, (limit,))
-
-        rows = cursor.fetchall()
-        conn.close()
-
-        operations = []
-        for row in rows:
-            operations.append({
-                "timestamp": row[0],
-                "tool": row[1],
-                "parameters": json.loads(row[2]) if row[2] else None,
-                "result": row[3],
-                "success": bool(row[4]),
-                "duration_ms": row[5]
-            })
-
-        return json.dumps({"operations": operations, "count": len(operations)}, indent=2)
+        # Include operations still waiting in the write queue
+        flush_operation_log()
+
+        with _db() as conn:
+            rows = conn.execute(_HISTORY_QUERY, (limit,)).fetchall()
+
+        operations = [
+            {
+                "timestamp": timestamp,
+                "tool": tool_name,
+                "parameters": _json_passthrough(parameters) if parameters else None,
+                "result": result,
+                "success": bool(success),
+                "duration_ms": duration_ms,
+            }
+            for timestamp, tool_name, parameters, result, success, duration_ms in rows
+        ]
+
+        return _json_dumps({"operations": operations, "count": len(operations)}, indent=True)
 
     except Exception as e:
-        return json.dumps({"error": f"Failed to get history: {str(e)}"})
+        return _json_dumps({"error": f"Failed to get history: {str(e)}"})
 
 
 @mcp.tool()
@@ -800,15 +1283,15 @@ def organize_downloads(file_type: str = "all", dry_run: bool = False) -> str:
     Returns:
         Result of the organization operation including files moved.
     """
-    start_time = datetime.now()
+    start_ns = time.perf_counter_ns()
     params = {"file_type": file_type, "dry_run": dry_run}
 
     try:
         repo = REPOS["downloads_organizer"]
-        if not repo.exists():
+        if not _repo_exists("downloads_organizer"):
             error_msg = f"downloads-organizer not found at {repo}"
             log_operation("organize_downloads", params, error_msg, False)
-            return json.dumps({"error": error_msg})
+            return _json_dumps({"error": error_msg})
 
         results = {
             "file_type": file_type,
@@ -817,40 +1300,35 @@ def organize_downloads(file_type: str = "all", dry_run: bool = False) -> str:
             "media": None,
         }
 
-        # Run PDF organizer
+        # Organizer subcommands as (result key, argv, timeout in seconds)
+        jobs = []
         if file_type in ["pdf", "all"]:
-            cmd = [sys.executable, "-m", "downloads_organizer", "pdf"]
-            if dry_run:
-                cmd.append("--dry-run")
-            else:
-                cmd.append("--yes")
-
-            success, stdout, stderr = run_command(cmd, cwd=repo / "src", timeout=300)
-            results["pdf"] = {
-                "success": success,
-                "output": stdout[-2000:] if stdout else None,  # Last 2000 chars
-                "error": stderr if not success else None,
-            }
-
-        # Run media organizer (--no-audit for speed, skip recursive folder scan)
+            jobs.append(("pdf", ["pdf"], 300))
         if file_type in ["media", "all"]:
-            cmd = [sys.executable, "-m", "downloads_organizer", "media", "--no-audit"]
-            if dry_run:
-                cmd.append("--dry-run")
-            else:
-                cmd.append("--yes")
-
-            success, stdout, stderr = run_command(cmd, cwd=repo / "src", timeout=60)
-            results["media"] = {
-                "success": success,
-                "output": stdout[-2000:] if stdout else None,
-                "error": stderr if not success else None,
-            }
+            # --no-audit for speed, skip recursive folder scan
+            jobs.append(("media", ["media", "--no-audit"], 60))
+
+        def _run_organizer(job: tuple) -> tuple:
+            kind, args, timeout = job
+            cmd = [sys.executable, "-m", "downloads_organizer", *args]
+            cmd.append("--dry-run" if dry_run else "--yes")
+            return kind, run_command(cmd, cwd=repo / "src", timeout=timeout, max_output=OUTPUT_TAIL_CHARS)
+
+        # PDF and media handle disjoint file types, so run them side by side
+        with ThreadPoolExecutor(max_workers=max(len(jobs), 1)) as executor:
+            for kind, (success, stdout, stderr) in executor.map(_run_organizer, jobs):
+                results[kind] = {
+                    "success": success,
+                    "output": stdout or None,  # Last OUTPUT_TAIL_CHARS chars
+                    "error": stderr if not success else None,
+                }
 
         # Check remaining files
+        # Files were just moved, so rescan (and refresh the shared counts)
+        remaining = count_pending_downloads(max_age=0)
         results["remaining"] = {
-            "pdfs": count_files_in_downloads(["pdf"]),
-            "media": count_files_in_downloads(["jpg", "jpeg", "png", "heic", "mov", "mp4", "mp3"]),
+            "pdfs": remaining["pdf"],
+            "media": remaining["media"],
         }
 
         # Determine overall success
@@ -861,15 +1339,15 @@ def organize_downloads(file_type: str = "all", dry_run: bool = False) -> str:
             overall_success = False
 
         # Log operation
-        duration_ms = int((datetime.now() - start_time).total_seconds() * 1000)
-        log_operation("organize_downloads", params, json.dumps(results["remaining"]), overall_success, duration_ms)
+        duration_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
+        log_operation("organize_downloads", params, _json_dumps(results["remaining"]), overall_success, duration_ms)
 
-        return json.dumps(results, indent=2, default=str)
+        return _json_dumps(results, indent=True)
 
     except Exception as e:
         error_msg = f"Error organizing downloads: {str(e)}"
         log_operation("organize_downloads", params, error_msg, False)
-        return json.dumps({"error": error_msg})
+        return _json_dumps({"error": error_msg})
 
 
 @mcp.tool()
@@ -883,14 +1361,14 @@ def sync_notion_context() -> str:
     Returns:
         Result of the sync operation.
     """
-    start_time = datetime.now()
+    start_ns = time.perf_counter_ns()
 
     try:
         repo = REPOS["context_sync"]
-        if not repo.exists():
+        if not _repo_exists("context_sync"):
             error_msg = f"treehouse-context-sync not found at {repo}"
             log_operation("sync_notion_context", {}, error_msg, False)
-            return json.dumps({"error": error_msg})
+            return _json_dumps({"error": error_msg})
 
         # Run the sync script
         sync_script = repo / "sync.py"
@@ -901,17 +1379,18 @@ def sync_notion_context() -> str:
         if not sync_script.exists():
             error_msg = "sync.py not found in treehouse-context-sync"
             log_operation("sync_notion_context", {}, error_msg, False)
-            return json.dumps({"error": error_msg})
+            return _json_dumps({"error": error_msg})
 
         success, stdout, stderr = run_command(
             [sys.executable, str(sync_script)],
             cwd=repo,
-            timeout=300
+            timeout=300,
+            max_output=OUTPUT_TAIL_CHARS
         )
 
         result = {
             "success": success,
-            "output": stdout[-2000:] if stdout else None,
+            "output": stdout or None,
             "error": stderr if not success else None,
         }
 
@@ -923,15 +1402,15 @@ def sync_notion_context() -> str:
                 result["last_sync"] = mtime.isoformat()
 
         # Log operation
-        duration_ms = int((datetime.now() - start_time).total_seconds() * 1000)
+        duration_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
         log_operation("sync_notion_context", {}, "success" if success else stderr, success, duration_ms)
 
-        return json.dumps(result, indent=2, default=str)
+        return _json_dumps(result, indent=True)
 
     except Exception as e:
         error_msg = f"Error syncing context: {str(e)}"
         log_operation("sync_notion_context", {}, error_msg, False)
-        return json.dumps({"error": error_msg})
+        return _json_dumps({"error": error_msg})
 
 
 @mcp.tool()
@@ -945,14 +1424,14 @@ def extract_tax_documents() -> str:
     Returns:
         Result of the extraction operation.
     """
-    start_time = datetime.now()
+    start_ns = time.perf_counter_ns()
 
     try:
         repo = REPOS["notion_rules"]
-        if not repo.exists():
+        if not _repo_exists("notion_rules"):
             error_msg = f"notion-rules not found at {repo}"
             log_operation("extract_tax_documents", {}, error_msg, False)
-            return json.dumps({"error": error_msg})
+            return _json_dumps({"error": error_msg})
 
         # Find the main extraction script
         extract_script = repo / "tax-years/extract_tax_data.py"
@@ -962,17 +1441,18 @@ def extract_tax_documents() -> str:
         if not extract_script.exists():
             error_msg = "Tax extraction script not found in notion-rules"
             log_operation("extract_tax_documents", {}, error_msg, False)
-            return json.dumps({"error": error_msg})
+            return _json_dumps({"error": error_msg})
 
         success, stdout, stderr = run_command(
             [sys.executable, str(extract_script)],
             cwd=repo,
-            timeout=600  # 10 minutes for OCR processing
+            timeout=600,  # 10 minutes for OCR processing
+            max_output=OUTPUT_TAIL_CHARS
         )
 
         result = {
             "success": success,
-            "output": stdout[-2000:] if stdout else None,
+            "output": stdout or None,
             "error": stderr if not success else None,
         }
 
@@ -980,26 +1460,23 @@ def extract_tax_documents() -> str:
         checkpoint = repo / "tax-years/data/processing_checkpoint.json"
         if checkpoint.exists():
             try:
-                with open(checkpoint) as f:
-                    data = json.load(f)
-                    result["processed"] = len(data.get("results", []))
-                    result["needs_review"] = sum(
-                        1 for r in data.get("results", [])
-                        if r.get("needs_review", False)
-                    )
+                with open(checkpoint, "rb") as f:
+                    results = _json_loads(f.read()).get("results", [])
+                result["processed"] = len(results)
+                result["needs_review"] = sum(1 for r in results if r.get("needs_review", False))
             except Exception:
                 pass
 
         # Log operation
-        duration_ms = int((datetime.now() - start_time).total_seconds() * 1000)
+        duration_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
         log_operation("extract_tax_documents", {}, "success" if success else stderr, success, duration_ms)
 
-        return json.dumps(result, indent=2, default=str)
+        return _json_dumps(result, indent=True)
 
     except Exception as e:
         error_msg = f"Error extracting tax documents: {str(e)}"
         log_operation("extract_tax_documents", {}, error_msg, False)
-        return json.dumps({"error": error_msg})
+        return _json_dumps({"error": error_msg})
 
 
 @mcp.tool()
@@ -1016,17 +1493,17 @@ def get_financial_summary(days: int = 30) -> str:
     Returns:
         Instructions for accessing Monarch Money data.
     """
-    start_time = datetime.now()
+    start_ns = time.perf_counter_ns()
     params = {"days": days}
 
     try:
         # Check Monarch session status
         session_status = "unknown"
-        if MONARCH_SESSION.exists():
-            mtime = get_file_mtime(MONARCH_SESSION)
-            if mtime:
-                age_days = (datetime.now() - mtime).days
-                session_status = "connected" if age_days <= 7 else "stale"
+        # get_file_mtime is a single stat and returns None for a missing file
+        mtime = get_file_mtime(MONARCH_SESSION)
+        if mtime:
+            age_days = (datetime.now() - mtime).days
+            session_status = "connected" if age_days <= 7 else "stale"
         else:
             session_status = "not_authenticated"
 
@@ -1056,15 +1533,15 @@ If session is stale, run: python ~/Documents/monarch-mcp-server/login_setup.py
             result["attention"] = "Monarch session may be stale. Consider re-authenticating."
 
         # Log operation
-        duration_ms = int((datetime.now() - start_time).total_seconds() * 1000)
+        duration_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
         log_operation("get_financial_summary", params, session_status, True, duration_ms)
 
-        return json.dumps(result, indent=2, default=str)
+        return _json_dumps(result, indent=True)
 
     except Exception as e:
         error_msg = f"Error getting financial summary: {str(e)}"
         log_operation("get_financial_summary", params, error_msg, False)
-        return json.dumps({"error": error_msg})
+        return _json_dumps({"error": error_msg})
 
 
 @mcp.tool()
@@ -1079,7 +1556,7 @@ def validate_monarch_connection() -> str:
     Returns:
         Current health status with details.
     """
-    start_time = datetime.now()
+    start_ns = time.perf_counter_ns()
 
     try:
         # Read health report
@@ -1090,10 +1567,10 @@ def validate_monarch_connection() -> str:
                 "recommendation": "Start the Monarch MCP server or run login_setup.py",
             }
             log_operation("validate_monarch_connection", {}, "no_health_report", False)
-            return json.dumps(result, indent=2)
+            return _json_dumps(result, indent=True)
 
-        with open(MONARCH_HEALTH_REPORT) as f:
-            health_data = json.load(f)
+        with open(MONARCH_HEALTH_REPORT, "rb") as f:
+            health_data = _json_loads(f.read())
 
         # Log to database for trend analysis
         log_monarch_health_check(health_data)
@@ -1131,15 +1608,43 @@ def validate_monarch_connection() -> str:
             result["interpretation"] = "Monarch Money status cannot be determined"
 
         # Log operation
-        duration_ms = int((datetime.now() - start_time).total_seconds() * 1000)
+        duration_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
         log_operation("validate_monarch_connection", {}, status, status == "healthy", duration_ms)
 
-        return json.dumps(result, indent=2, default=str)
+        return _json_dumps(result, indent=True)
 
     except Exception as e:
         error_msg = f"Error validating Monarch connection: {str(e)}"
         log_operation("validate_monarch_connection", {}, error_msg, False)
-        return json.dumps({"error": error_msg})
+        return _json_dumps({"error": error_msg})
+
+
+_HEALTH_HISTORY_QUERY = """
+    SELECT timestamp, status, session_valid, session_age_days, api_reachable, error_message, library_version, update_available
+    FROM monarch_health_checks
+    WHERE timestamp > ?
+    ORDER BY timestamp DESC
+    LIMIT ?
+"""
+
+
+# Trend counts over the same window the history query covers
+_HEALTH_TREND_QUERY = """
+    SELECT COUNT(*),
+           COALESCE(SUM(status = 'healthy'), 0),
+           COALESCE(SUM(status = 'unhealthy'), 0),
+           COALESCE(SUM(COALESCE(api_reachable, 0) = 0), 0)
+    FROM (
+        SELECT status, api_reachable
+        FROM monarch_health_checks
+        WHERE timestamp > ?
+        ORDER BY timestamp DESC
+        LIMIT ?
+    )
+"""
+
+# Health check records included in the get_monarch_health_history response
+HEALTH_HISTORY_RETURNED = 20
 
 
 @mcp.tool()
@@ -1157,61 +1662,59 @@ def get_monarch_health_history(days: int = 7, limit: int = 50) -> str:
     Returns:
         Historical health check data with trend analysis.
     """
-    start_time = datetime.now()
+    start_ns = time.perf_counter_ns()
     params = {"days": days, "limit": limit}
 
     try:
-        conn = sqlite3.connect(str(DB_PATH))
-        cursor = conn.cursor()
-
         # Get recent health checks
         cutoff = (datetime.now() - timedelta(days=days)).isoformat()
 
-        cursor.execute("""
-            SELECT timestamp, status, session_valid, session_age_days, api_reachable, error_message, library_version, update_available
-            FROM monarch_health_checks
-            WHERE timestamp > ?
-            ORDER BY timestamp DESC
-            LIMIT ?
-        """, (cutoff, limit))
+        # Include checks still waiting in the write queue
+        flush_operation_log()
 
-        rows = cursor.fetchall()
-        conn.close()
+        with _db() as conn:
+            total, healthy_count, unhealthy_count, api_failures = conn.execute(
+                _HEALTH_TREND_QUERY, (cutoff, limit)
+            ).fetchone()
+            # Only the newest HEALTH_HISTORY_RETURNED rows are returned
+            rows = conn.execute(
+                _HEALTH_HISTORY_QUERY, (cutoff, min(limit, HEALTH_HISTORY_RETURNED))
+            ).fetchall()
 
         # Build history
-        history = []
-        for row in rows:
-            history.append({
-                "timestamp": row[0],
-                "status": row[1],
-                "session_valid": bool(row[2]),
-                "session_age_days": row[3],
-                "api_reachable": bool(row[4]),
-                "error_message": row[5],
-                "library_version": row[6],
-                "update_available": bool(row[7]),
-            })
-
-        # Calculate trend metrics
-        if history:
-            healthy_count = sum(1 for h in history if h["status"] == "healthy")
-            unhealthy_count = sum(1 for h in history if h["status"] == "unhealthy")
-            api_failures = sum(1 for h in history if not h["api_reachable"])
+        history = [
+            {
+                "timestamp": timestamp,
+                "status": status,
+                "session_valid": bool(session_valid),
+                "session_age_days": session_age_days,
+                "api_reachable": bool(api_reachable),
+                "error_message": error_message,
+                "library_version": library_version,
+                "update_available": bool(update_available),
+            }
+            for (
+                timestamp, status, session_valid, session_age_days, api_reachable,
+                error_message, library_version, update_available,
+            ) in rows
+        ]
 
+        # Trend metrics (aggregated by SQLite over the newest `limit` checks)
+        if total:
             trend = {
-                "total_checks": len(history),
+                "total_checks": total,
                 "healthy_count": healthy_count,
                 "unhealthy_count": unhealthy_count,
                 "api_failure_count": api_failures,
-                "health_rate": round(healthy_count / len(history) * 100, 1) if history else 0,
-                "api_success_rate": round((len(history) - api_failures) / len(history) * 100, 1) if history else 0,
+                "health_rate": round(healthy_count / total * 100, 1),
+                "api_success_rate": round((total - api_failures) / total * 100, 1),
             }
 
             # Identify patterns
-            if unhealthy_count > len(history) * 0.3:
+            if unhealthy_count > total * 0.3:
                 trend["pattern"] = "frequent_issues"
                 trend["recommendation"] = "Consider re-authenticating or checking for library updates"
-            elif api_failures > len(history) * 0.2:
+            elif api_failures > total * 0.2:
                 trend["pattern"] = "api_instability"
                 trend["recommendation"] = "API has been intermittently unreachable"
             else:
@@ -1226,19 +1729,63 @@ def get_monarch_health_history(days: int = 7, limit: int = 50) -> str:
         result = {
             "period_days": days,
             "trend": trend,
-            "history": history[:20],  # Return last 20 for readability
+            "history": history,  # Last HEALTH_HISTORY_RETURNED, for readability
         }
 
         # Log operation
-        duration_ms = int((datetime.now() - start_time).total_seconds() * 1000)
-        log_operation("get_monarch_health_history", params, f"{len(history)} records", True, duration_ms)
+        duration_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
+        log_operation("get_monarch_health_history", params, f"{total} records", True, duration_ms)
 
-        return json.dumps(result, indent=2, default=str)
+        return _json_dumps(result, indent=True)
 
     except Exception as e:
         error_msg = f"Error getting health history: {str(e)}"
         log_operation("get_monarch_health_history", params, error_msg, False)
-        return json.dumps({"error": error_msg})
+        return _json_dumps({"error": error_msg})
+
+
+def _check_repo(name: str, path: Path) -> tuple:
+    """
+    Audit one repository for run_reconciliation.
+
+    Returns:
+        Tuple of (repo check record, list of report-level issues).
+    """
+    repo_check = {"repo": name, "path": str(path), "status": "unknown", "issues": []}
+    issues = []
+
+    if not path.exists():
+        repo_check["status"] = "missing"
+        repo_check["issues"].append("Repository not found")
+        issues.append(f"{name}: Repository not found")
+    else:
+        # Check if it's a git repo
+        git_dir = path / ".git"
+        if git_dir.exists():
+            # Branch and uncommitted changes from a single git call
+            success, stdout, _ = run_command(
+                ["git", "status", "--branch", "--porcelain=v1"],
+                cwd=path,
+                timeout=10
+            )
+            branch, dirty = parse_git_status(stdout) if success else (None, False)
+            if dirty:
+                repo_check["status"] = "dirty"
+                repo_check["issues"].append("Uncommitted changes")
+                issues.append(f"{name}: Has uncommitted changes")
+            else:
+                repo_check["status"] = "clean"
+
+            if branch:
+                repo_check["branch"] = branch
+                if branch != "main":
+                    repo_check["issues"].append(f"Not on main branch (on {branch})")
+                    issues.append(f"{name}: On branch {branch}, not main")
+        else:
+            repo_check["status"] = "not_git"
+            repo_check["issues"].append("Not a git repository")
+
+    return repo_check, issues
 
 
 @mcp.tool()
@@ -1256,54 +1803,22 @@ def run_reconciliation() -> str:
     Returns:
         Reconciliation report with any issues found.
     """
-    start_time = datetime.now()
+    start_ns = time.perf_counter_ns()
 
     try:
         issues = []
         checks = []
 
-        # Check all repos
-        for name, path in REPOS.items():
-            repo_check = {"repo": name, "path": str(path), "status": "unknown", "issues": []}
+        # Audit against the live system, and refresh the cached probes used
+        # by the status checks while we're at it
+        reset_caches()
 
-            if not path.exists():
-                repo_check["status"] = "missing"
-                repo_check["issues"].append("Repository not found")
-                issues.append(f"{name}: Repository not found")
-            else:
-                # Check if it's a git repo
-                git_dir = path / ".git"
-                if git_dir.exists():
-                    # Check for uncommitted changes
-                    success, stdout, _ = run_command(
-                        ["git", "status", "--porcelain"],
-                        cwd=path,
-                        timeout=10
-                    )
-                    if success and stdout.strip():
-                        repo_check["status"] = "dirty"
-                        repo_check["issues"].append("Uncommitted changes")
-                        issues.append(f"{name}: Has uncommitted changes")
-                    else:
-                        repo_check["status"] = "clean"
-
-                    # Check current branch
-                    success, stdout, _ = run_command(
-                        ["git", "rev-parse", "--abbrev-ref", "HEAD"],
-                        cwd=path,
-                        timeout=10
-                    )
-                    if success:
-                        branch = stdout.strip()
-                        repo_check["branch"] = branch
-                        if branch != "main":
-                            repo_check["issues"].append(f"Not on main branch (on {branch})")
-                            issues.append(f"{name}: On branch {branch}, not main")
-                else:
-                    repo_check["status"] = "not_git"
-                    repo_check["issues"].append("Not a git repository")
-
-            checks.append(repo_check)
+        # Check all repos; each is independent and waits on git, so run them
+        # concurrently (map() keeps REPOS order)
+        with ThreadPoolExecutor(max_workers=min(16, len(REPOS))) as executor:
+            for repo_check, repo_issues in executor.map(_check_repo, REPOS.keys(), REPOS.values()):
+                checks.append(repo_check)
+                issues.extend(repo_issues)
 
         # Check LaunchAgents
         for name, label in LAUNCHAGENTS.items():
@@ -1312,12 +1827,9 @@ def run_reconciliation() -> str:
                 issues.append(f"LaunchAgent {name}: Not loaded")
 
         # Check Monarch session
-        if MONARCH_SESSION.exists():
-            mtime = get_file_mtime(MONARCH_SESSION)
-            if mtime:
-                age_days = (datetime.now() - mtime).days
-                if age_days > 7:
-                    issues.append("Monarch session is stale (>7 days old)")
+        mtime = get_file_mtime(MONARCH_SESSION)
+        if mtime and (datetime.now() - mtime).days > 7:
+            issues.append("Monarch session is stale (>7 days old)")
 
         result = {
             "timestamp": datetime.now().isoformat(),
@@ -1328,15 +1840,15 @@ def run_reconciliation() -> str:
         }
 
         # Log operation
-        duration_ms = int((datetime.now() - start_time).total_seconds() * 1000)
+        duration_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
         log_operation("run_reconciliation", {}, f"{len(issues)} issues", len(issues) == 0, duration_ms)
 
-        return json.dumps(result, indent=2, default=str)
+        return _json_dumps(result, indent=True)
 
     except Exception as e:
         error_msg = f"Error running reconciliation: {str(e)}"
         log_operation("run_reconciliation", {}, error_msg, False)
-        return json.dumps({"error": error_msg})
+        return _json_dumps({"error": error_msg})
 
 
 # =============================================================================
@@ -1344,56 +1856,77 @@ def run_reconciliation() -> str:
 # =============================================================================
 
 @mcp.tool()
-def get_pending_requests() -> str:
+def get_pending_requests(
+    page_size: int = 25,
+    since: Optional[str] = None,
+    cursor: Optional[str] = None,
+) -> str:
     """
     Get pending automation requests from Notion Control Plane.
 
     Returns queued requests that are waiting to be processed.
     These requests can be created from any device via the Notion app.
+    When more requests remain, pass the returned next_cursor to fetch them.
+
+    Args:
+        page_size: Maximum requests to return, up to 100 (default: 25)
+        since: Only return requests edited on or after this ISO 8601 time,
+            for incremental polling (default: all)
+        cursor: next_cursor from a previous call to continue paging
 
     Returns:
         List of pending requests with their details.
     """
-    start_time = datetime.now()
+    start_ns = time.perf_counter_ns()
+    params = {"page_size": page_size, "since": since, "cursor": cursor}
 
     try:
         from . import notion_control
 
-        requests = notion_control.get_pending_requests()
+        requests, next_cursor = notion_control.query_pending_requests(
+            page_size=page_size,
+            since=since,
+            start_cursor=cursor,
+        )
 
         result = {
             "pending_count": len(requests),
             "requests": requests,
+            "next_cursor": next_cursor,
         }
 
         if not requests:
             result["message"] = "No pending requests"
 
         # Log operation
-        duration_ms = int((datetime.now() - start_time).total_seconds() * 1000)
-        log_operation("get_pending_requests", {}, f"{len(requests)} pending", True, duration_ms)
+        duration_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
+        log_operation("get_pending_requests", params, f"{len(requests)} pending", True, duration_ms)
 
-        return json.dumps(result, indent=2, default=str)
+        return _json_dumps(result, indent=True)
 
     except Exception as e:
         error_msg = f"Error getting pending requests: {str(e)}"
-        log_operation("get_pending_requests", {}, error_msg, False)
-        return json.dumps({"error": error_msg})
+        log_operation("get_pending_requests", params, error_msg, False)
+        return _json_dumps({"error": error_msg})
 
 
 @mcp.tool()
-def process_automation_request(request_id: str) -> str:
+def process_automation_request(request_id: str, force: bool = False) -> str:
     """
     Manually process a specific automation request from Notion.
 
+    Requests that are already running (claimed by the poller or another
+    call) are skipped so they don't execute twice.
+
     Args:
         request_id: The Notion page ID of the request to process
+        force: Process the request even if it is already running (default: False)
 
     Returns:
         Result of processing the request.
     """
-    start_time = datetime.now()
-    params = {"request_id": request_id}
+    start_ns = time.perf_counter_ns()
+    params = {"request_id": request_id, "force": force}
 
     try:
         from . import notion_control
@@ -1401,50 +1934,65 @@ def process_automation_request(request_id: str) -> str:
         # Get the request details
         client = notion_control.get_notion_client()
         if not client:
-            return json.dumps({"error": "Notion client not available"})
+            return _json_dumps({"error": "Notion client not available"})
 
-        page = client.pages.retrieve(page_id=request_id)
+        page = notion_control.call_notion(client.pages.retrieve, page_id=request_id)
         request = notion_control.parse_request_page(page)
 
         if not request:
-            return json.dumps({"error": "Failed to parse request"})
+            return _json_dumps({"error": "Failed to parse request"})
 
-        # Mark as running
-        notion_control.update_request_status(request_id, notion_control.STATUS_RUNNING)
+        if request["status"] == notion_control.STATUS_RUNNING and not force:
+            result = {"request": request, "skipped": True, "reason": "already claimed"}
+            duration_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
+            log_operation("process_automation_request", params, "skipped: already claimed", True, duration_ms)
+            return _json_dumps(result, indent=True)
 
-        # Execute
-        success, result_msg = notion_control.execute_request(request)
-
-        # Update status
-        if success:
-            notion_control.update_request_status(
-                request_id,
-                notion_control.STATUS_DONE,
-                result=result_msg
-            )
-        else:
-            notion_control.update_request_status(
-                request_id,
-                notion_control.STATUS_FAILED,
-                result=result_msg
-            )
+        # Execute; "running" is only written if this outlasts the delay, so a
+        # quick command costs a single terminal status update. A manual run
+        # always executes rather than reusing a recent identical result.
+        success, result_msg, updates = notion_control.process_request(request, reuse_results=False)
+        status_updated = all([future.result() for future in updates])
 
         result = {
             "request": request,
             "success": success,
             "result": result_msg,
+            "status_updated": status_updated,
         }
+        if not status_updated:
+            result["status_error"] = "Failed to update the request status in Notion"
 
         # Log operation
-        duration_ms = int((datetime.now() - start_time).total_seconds() * 1000)
-        log_operation("process_automation_request", params, result_msg, success, duration_ms)
+        duration_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
+        log_operation("process_automation_request", params, result_msg, success and status_updated, duration_ms)
 
-        return json.dumps(result, indent=2, default=str)
+        return _json_dumps(result, indent=True)
 
     except Exception as e:
         error_msg = f"Error processing request: {str(e)}"
         log_operation("process_automation_request", params, error_msg, False)
-        return json.dumps({"error": error_msg})
+        return _json_dumps({"error": error_msg})
+
+
+# Shown by setup_notion_control_plane when called without arguments
+NOTION_SETUP_INSTRUCTIONS = """To setup Notion Control Plane:
+
+1. Create database under existing page:
+   setup_notion_control_plane(parent_page_id="your-page-id")
+
+2. Or use existing database:
+   setup_notion_control_plane(database_id="your-db-id")
+
+The database should have these properties:
+- Request (title)
+- Type (select): organize, extract, sync, reconcile, custom
+- Target (select): tax, media, all, treehouse, yourco, tap, personal
+- Status (select): queued, running, done, failed
+- Created (date)
+- Completed (date)
+- Result (rich_text)
+- Error (rich_text)"""
 
 
 @mcp.tool()
@@ -1461,7 +2009,7 @@ def setup_notion_control_plane(parent_page_id: Optional[str] = None, database_id
     Returns:
         Setup result with database ID.
     """
-    start_time = datetime.now()
+    start_ns = time.perf_counter_ns()
     params = {"parent_page_id": parent_page_id, "database_id": database_id}
 
     try:
@@ -1502,37 +2050,19 @@ def setup_notion_control_plane(parent_page_id: Optional[str] = None, database_id
             result = {
                 "configured": bool(db_id),
                 "database_id": db_id,
-                "instructions": """
-To setup Notion Control Plane:
-
-1. Create database under existing page:
-   setup_notion_control_plane(parent_page_id="your-page-id")
-
-2. Or use existing database:
-   setup_notion_control_plane(database_id="your-db-id")
-
-The database should have these properties:
-- Request (title)
-- Type (select): organize, extract, sync, reconcile, custom
-- Target (select): tax, media, all, treehouse, yourco, tap, personal
-- Status (select): queued, running, done, failed
-- Created (date)
-- Completed (date)
-- Result (rich_text)
-- Error (rich_text)
-                """.strip()
+                "instructions": NOTION_SETUP_INSTRUCTIONS,
             }
 
         # Log operation
-        duration_ms = int((datetime.now() - start_time).total_seconds() * 1000)
+        duration_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
         log_operation("setup_notion_control_plane", params, str(result.get("database_id")), result.get("success", True), duration_ms)
 
-        return json.dumps(result, indent=2, default=str)
+        return _json_dumps(result, indent=True)
 
     except Exception as e:
         error_msg = f"Error setting up control plane: {str(e)}"
         log_operation("setup_notion_control_plane", params, error_msg, False)
-        return json.dumps({"error": error_msg})
+        return _json_dumps({"error": error_msg})
 
 
 # =============================================================================
@@ -1540,7 +2070,12 @@ The database should have these properties:
 # =============================================================================
 
 @mcp.tool()
-def get_daily_briefing(include_financial: bool = True, include_calendar: bool = True) -> str:
+def get_daily_briefing(
+    include_financial: bool = True,
+    include_calendar: bool = True,
+    force_refresh: bool = False,
+    include_raw: bool = False,
+) -> str:
     """
     Generate a comprehensive daily briefing.
 
@@ -1551,15 +2086,24 @@ def get_daily_briefing(include_financial: bool = True, include_calendar: bool =
     - Automation requests pending in Notion
     - Calendar events (if icalBuddy is installed)
 
+    Briefings are cached for BRIEFING_CACHE_TTL seconds (default: 120).
+
     Args:
         include_financial: Include Monarch Money data (default: True)
         include_calendar: Include calendar events (default: True)
+        force_refresh: Rebuild the briefing instead of using the cache (default: False)
+        include_raw: Also return the structured briefing data (default: False)
 
     Returns:
         Formatted briefing as markdown text.
     """
-    start_time = datetime.now()
-    params = {"include_financial": include_financial, "include_calendar": include_calendar}
+    start_ns = time.perf_counter_ns()
+    params = {
+        "include_financial": include_financial,
+        "include_calendar": include_calendar,
+        "force_refresh": force_refresh,
+        "include_raw": include_raw,
+    }
 
     try:
         from . import daily_briefing
@@ -1567,24 +2111,24 @@ def get_daily_briefing(include_financial: bool = True, include_calendar: bool =
         briefing = daily_briefing.generate_briefing(
             include_financial=include_financial,
             include_calendar=include_calendar,
+            force_refresh=force_refresh,
         )
 
-        # Return both formatted text and raw data
-        result = {
-            "formatted": daily_briefing.format_briefing_text(briefing),
-            "data": briefing,
-        }
+        # The raw data repeats most of the text, so it is only sent on request
+        result = {"formatted": daily_briefing.format_briefing_text(briefing)}
+        if include_raw:
+            result["data"] = briefing
 
         # Log operation
-        duration_ms = int((datetime.now() - start_time).total_seconds() * 1000)
+        duration_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
         log_operation("get_daily_briefing", params, briefing.get("summary", ""), True, duration_ms)
 
-        return json.dumps(result, indent=2, default=str)
+        return _json_dumps(result, indent=True)
 
     except Exception as e:
         error_msg = f"Error generating briefing: {str(e)}"
         log_operation("get_daily_briefing", params, error_msg, False)
-        return json.dumps({"error": error_msg})
+        return _json_dumps({"error": error_msg})
 
 
 # =============================================================================
@@ -1592,7 +2136,12 @@ def get_daily_briefing(include_financial: bool = True, include_calendar: bool =
 # =============================================================================
 
 @mcp.tool()
-def sync_monarch_to_notion(days: int = 7, dry_run: bool = False) -> str:
+async def sync_monarch_to_notion(
+    days: int = 7,
+    dry_run: bool = False,
+    check_duplicates: bool = False,
+    refresh_id_cache: bool = False,
+) -> str:
     """
     Sync transactions from Monarch Money to Notion.
 
@@ -1602,25 +2151,36 @@ def sync_monarch_to_notion(days: int = 7, dry_run: bool = False) -> str:
     Args:
         days: Number of days to sync (default: 7)
         dry_run: If True, preview changes without creating Notion pages
+        check_duplicates: With dry_run, also look up existing pages so the
+            preview skips duplicates (slower; real syncs always check)
+        refresh_id_cache: Re-check every transaction in Notion instead of the
+            local synced-ID cache, so ones whose pages were deleted sync again
 
     Returns:
         JSON with sync summary: synced count, skipped duplicates, errors
     """
-    import asyncio
-    start_time = datetime.now()
-    params = {"days": days, "dry_run": dry_run}
+    start_ns = time.perf_counter_ns()
+    params = {
+        "days": days,
+        "dry_run": dry_run,
+        "check_duplicates": check_duplicates,
+        "refresh_id_cache": refresh_id_cache,
+    }
 
     try:
         from . import monarch_sync
 
-        # Run the async sync function
-        result = asyncio.run(monarch_sync.sync_transactions(
+        # Runs on the server's own event loop, so the bounded-concurrency page
+        # creation overlaps with other requests instead of a throwaway loop
+        result = await monarch_sync.sync_transactions(
             days=days,
-            dry_run=dry_run
-        ))
+            dry_run=dry_run,
+            check_duplicates=check_duplicates,
+            refresh_id_cache=refresh_id_cache,
+        )
 
         # Log operation
-        duration_ms = int((datetime.now() - start_time).total_seconds() * 1000)
+        duration_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
         log_operation(
             "sync_monarch_to_notion",
             params,
@@ -1629,12 +2189,12 @@ def sync_monarch_to_notion(days: int = 7, dry_run: bool = False) -> str:
             duration_ms
         )
 
-        return json.dumps(result, indent=2, default=str)
+        return _json_dumps(result, indent=True)
 
     except Exception as e:
         error_msg = f"Error syncing Monarch to Notion: {str(e)}"
         log_operation("sync_monarch_to_notion", params, error_msg, False)
-        return json.dumps({"error": error_msg, "success": False})
+        return _json_dumps({"error": error_msg, "success": False})
 
 
 # =============================================================================